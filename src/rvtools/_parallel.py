@@ -0,0 +1,49 @@
+import multiprocessing
+import os
+
+# state handed to pool workers once, at start-up: pickled for spawn and
+# forkserver, inherited copy-on-write under fork
+_worker_func = None
+_worker_state = None
+
+
+def _init_worker(func, state):
+    global _worker_func, _worker_state
+    _worker_func = func
+    _worker_state = state
+
+
+def _run(item):
+    return _worker_func(_worker_state, item)
+
+
+def imap_with_state(func, state, items, workers=1, chunksize=None, start_method=None):
+    """
+    Yields func(state, item) for each item, in order.
+
+    With workers > 1 (None means one per CPU) the calls run in a
+    multiprocessing pool. state is shipped to each worker once at start-up,
+    so only items and results cross process boundaries. func must be
+    picklable by reference, i.e. a module-level function or a method looked
+    up on its class, and state must be picklable.
+
+    start_method picks the multiprocessing context ("spawn", "fork",
+    "forkserver"); None uses the platform default.
+    """
+    items = list(items)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(items) <= 1:
+        for item in items:
+            yield func(state, item)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 4))
+
+    ctx = multiprocessing.get_context(start_method)
+
+    with ctx.Pool(workers, initializer=_init_worker, initargs=(func, state)) as pool:
+        yield from pool.imap(_run, items, chunksize)
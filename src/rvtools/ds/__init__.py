@@ -1,15 +1,37 @@
 from .linked_list import LinkedList
+from .doubly_linked_list import DoublyLinkedList
 from .binary_tree import BinaryTree
+from .avl_tree import AVLTree
+from .sorted_list import SortedList
 from .stack import Stack
 from .queue import Queue
+from .priority_queue import PriorityQueue
+from .concurrent import ConcurrentQueue, ConcurrentStack, AsyncQueue, AsyncStack
 from .hash_map import HashMap
+from .hash_table import HashTable
+from .cache import Cache, cached
 from .graph import Graph
+from .csr_graph import CSRGraph
+from .union_find import UnionFind
 
 __all__ = [
     "LinkedList", 
+    "DoublyLinkedList",
     "BinaryTree",
+    "AVLTree",
+    "SortedList",
     "Stack",
     "Queue",
+    "PriorityQueue",
+    "ConcurrentQueue",
+    "ConcurrentStack",
+    "AsyncQueue",
+    "AsyncStack",
     "HashMap",
-    "Graph"
+    "HashTable",
+    "Cache",
+    "cached",
+    "Graph",
+    "CSRGraph",
+    "UnionFind"
     ]
\ No newline at end of file
@@ -0,0 +1,132 @@
+from .binary_tree import BinaryTree, BTNode, _size
+
+
+class AVLNode(BTNode):
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+def _h(node):
+    return node.height if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    node.height = 1 + max(_h(left), _h(right))
+    node.size = 1 + _size(left) + _size(right)
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _h(node.left) - _h(node.right)
+
+    if balance > 1:
+        if _h(node.left.left) < _h(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+
+    if balance < -1:
+        if _h(node.right.right) < _h(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+
+    return node
+
+
+class AVLTree(BinaryTree):
+    """
+    Self-balancing BinaryTree. Rotations on append/delete keep the height
+    within ~1.44 log2(n), so every lookup is O(log n) worst case, and each
+    node caches its subtree height alongside the subtree size.
+    """
+
+    _node_cls = AVLNode
+    _update_node = staticmethod(_update)
+
+    def append(self, data):             # O(log n)
+        def _insert(node):
+            if node is None:
+                return AVLNode(data)
+            if data < node.data:
+                node.left = _insert(node.left)
+            else:
+                node.right = _insert(node.right)
+            return _rebalance(node)
+
+        self.head = _insert(self.head)
+        self.size += 1
+
+    def delete(self, val):              # O(log n)
+        found = False
+
+        def _delete(node, val):
+            nonlocal found
+            if node is None:
+                return None
+
+            if val < node.data:
+                node.left = _delete(node.left, val)
+                return _rebalance(node)
+            elif val > node.data:
+                node.right = _delete(node.right, val)
+                return _rebalance(node)
+
+            found = True
+
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+
+            node.data = successor.data
+            node.right = _delete_min(node.right)
+            return _rebalance(node)
+
+        def _delete_min(node):
+            if node.left is None:
+                return node.right
+            node.left = _delete_min(node.left)
+            return _rebalance(node)
+
+        self.head = _delete(self.head, val)
+        if found:
+            self.size -= 1
+
+    def height(self):                   # O(1)
+        return _h(self.head)
+
+    def is_balanced(self):              # O(1)
+        # the AVL invariant holds at every node after each update
+        if self.head is None:
+            return True
+        return abs(_h(self.head.left) - _h(self.head.right)) <= 1
+
+    def balance(self):                  # O(1)
+        # already height-balanced; nothing to rebuild
+        pass
+
+    def __str__(self):
+        return "AVLTree(" + ", ".join(str(x) for x in self.inorder()) + ")"
@@ -1,13 +1,63 @@
+import heapq
+
+
 class BTNode:
     def __init__(self, data):
         self.data = data
         self.left: BTNode = None
         self.right: BTNode = None
+        self.size = 1                   # nodes in this subtree
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
 
 class BinaryTree:
+    _node_cls = BTNode
+
     def __init__(self):
         self.head = None
         self.size = 0
+
+    @classmethod
+    def from_sorted(cls, values):       # O(n)
+        """Balanced tree from values already in non-decreasing order."""
+        vals = list(values)
+        for i in range(len(vals) - 1):
+            if vals[i + 1] < vals[i]:
+                raise ValueError("from_sorted expects values in sorted order.")
+
+        tree = cls()
+        tree._load_sorted(vals)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, values):     # O(n log n)
+        """Balanced tree from values in any order (one sort, then O(n))."""
+        tree = cls()
+        tree._load_sorted(sorted(values))
+        return tree
+
+    def _load_sorted(self, vals):
+        self.head = self._build_balanced(vals, 0, len(vals))
+        self.size = len(vals)
+
+    def _build_balanced(self, vals, lo, hi):
+        # builds vals[lo:hi] without slicing; recursion depth is log2(n)
+        if lo >= hi:
+            return None
+
+        mid = (lo + hi) // 2
+        node = self._node_cls(vals[mid])
+        node.left = self._build_balanced(vals, lo, mid)
+        node.right = self._build_balanced(vals, mid + 1, hi)
+        self._update_node(node)
+        return node
+
+    @staticmethod
+    def _update_node(node):
+        node.size = 1 + _size(node.left) + _size(node.right)
   
     def append(self, data):             # O(log n)        
         new_node = BTNode(data)
@@ -19,6 +69,7 @@ class BinaryTree:
         
         current = self.head
         while True:
+            current.size += 1
             if data < current.data:
                 if current.left is None:
                     current.left = new_node
@@ -57,129 +108,229 @@ class BinaryTree:
             current = current.right
         return current.data
     
-    def inorder(self):                  # O(n)
-        result = []
-
-        def _inorder(node):
-            if node is None:
-                return
-            _inorder(node.left)
-            result.append(node.data)
-            _inorder(node.right)
+    def iter_inorder(self):             # O(n), lazy
+        stack = []
+        node = self.head
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node.data
+                node = node.right
 
-        _inorder(self.head)
-        return result
+    def inorder(self):                  # O(n)
+        return list(self.iter_inorder())
     
     def to_sorted_list(self):
         return self.inorder()
+
+    def iter_preorder(self):            # O(n), lazy
+        stack = [self.head] if self.head is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
     
     def preorder(self):                 # O(n)
-        result = []
-
-        def _preorder(node):
-            if node is None:
-                return
-            result.append(node.data)
-            _preorder(node.left)
-            _preorder(node.right)
-        
-        _preorder(self.head)
-        return result
+        return list(self.iter_preorder())
     
     def to_list(self):
         return self.preorder()
 
+    def iter_postorder(self):           # O(n), lazy
+        stack = []
+        last = None
+        node = self.head
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                top = stack[-1]
+                if top.right is not None and last is not top.right:
+                    node = top.right
+                else:
+                    yield top.data
+                    last = stack.pop()
+
     def postorder(self):                # O(n)
-        result = []
+        return list(self.iter_postorder())
 
-        def _postorder(node):
-            if node is None:
-                return
-            _postorder(node.left)
-            _postorder(node.right)
-            result.append(node.data)
-        
-        _postorder(self.head)
-        return result
+    def iter_range(self, lo, hi):       # O(log n + k), lazy
+        """Values v with lo <= v <= hi, in sorted order."""
+        stack = []
+        node = self.head
+        while stack or node is not None:
+            if node is not None:
+                if node.data < lo:
+                    # everything on the left is smaller still
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if node.data > hi:
+                    return
+                yield node.data
+                node = node.right
     
     def height(self):                   # O(n)
-        def _height(node):
-            if node is None:
-                return 0
-            left_h = _height(node.left)
-            right_h = _height(node.right)
-            return 1 + max(left_h, right_h)
-        
-        return _height(self.head)
+        level = [self.head] if self.head is not None else []
+        h = 0
+        while level:
+            h += 1
+            level = [c for n in level for c in (n.left, n.right) if c is not None]
+        return h
     
     def is_balanced(self):              # O(n)
-        def _check(node):
+        heights = {None: 0}
+        stack = [(self.head, False)]
+
+        while stack:
+            node, children_done = stack.pop()
             if node is None:
-                return 0, True
-            
-            left_h, left_bal = _check(node.left)
-            right_h, right_bal = _check(node.right)
-
-            height = 1 + max(left_h, right_h)
-            balanced = (
-                left_bal
-                and right_bal
-                and abs(left_h - right_h) <= 1
-            )
-            return height, balanced
-        
-        _, balanced = _check(self.head)
-        return balanced 
+                continue
+
+            if not children_done:
+                stack.append((node, True))
+                stack.append((node.right, False))
+                stack.append((node.left, False))
+                continue
+
+            left_h = heights.pop(node.left) if node.left is not None else 0
+            right_h = heights.pop(node.right) if node.right is not None else 0
+            if abs(left_h - right_h) > 1:
+                return False
+            heights[node] = 1 + max(left_h, right_h)
+
+        return True
     
     def delete(self, val):              # O(log n)
-        def _delete(node, val):
-            if node is None:
-                return None
-            
-            if val < node.data:
-                node.left = _delete(node.left, val)
-                return node
-            elif val > node.data:
-                node.right = _delete(node.right, val)
-                return node
-            
-            if node.left is None and node.right is None:
-                return None
-            
-            if node.left is None:
-                return node.right
-            if node.right is None:
-                return node.left
-            
+        path = []                       # ancestors of the node that gets unlinked
+        parent = None
+        node = self.head
+        while node is not None and node.data != val:
+            path.append(node)
+            parent = node
+            node = node.left if val < node.data else node.right
+
+        if node is None:
+            return
+
+        if node.left is not None and node.right is not None:
+            # copy the in-order successor up, then unlink the successor instead
+            path.append(node)
+            succ_parent = node
             successor = node.right
             while successor.left is not None:
+                path.append(successor)
+                succ_parent = successor
                 successor = successor.left
 
             node.data = successor.data
+            parent, node = succ_parent, successor
 
-            node.right = _delete(node.right, successor.data)
+        for ancestor in path:
+            ancestor.size -= 1
+        self.size -= 1
 
-            return node
-        
-        self.head = _delete(self.head, val)
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.head = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
     def balance(self):                  # O(n)
-        vals = self.inorder()
+        self._load_sorted(self.inorder())
+
+    def merge(self, other):             # O(n + m)
+        """Merge other's values into this tree, rebuilding it balanced."""
+        merged = list(heapq.merge(self.iter_inorder(), other.iter_inorder()))
+        self._load_sorted(merged)
 
-        def build_balanced(sorted_vals):
-            if not sorted_vals:
-                return None
+    def rank(self, x):                  # O(height)
+        """Number of values strictly less than x."""
+        count = 0
+        node = self.head
+        while node is not None:
+            if node.data < x:
+                count += 1 + _size(node.left)
+                node = node.right
+            else:
+                node = node.left
+        return count
 
-            mid = len(sorted_vals) // 2
-            node = BTNode(sorted_vals[mid])
-            node.left = build_balanced(sorted_vals[:mid])
-            node.right = build_balanced(sorted_vals[mid+1:])
-            return node
+    def _rank_le(self, x):
+        count = 0
+        node = self.head
+        while node is not None:
+            if node.data <= x:
+                count += 1 + _size(node.left)
+                node = node.right
+            else:
+                node = node.left
+        return count
 
-        self.head = build_balanced(vals)
+    def select(self, k):                # O(height)
+        """The k-th smallest value, 0-based."""
+        if k < 0 or k >= _size(self.head):
+            raise IndexError("Index out of Range")
+
+        node = self.head
+        while True:
+            left = _size(node.left)
+            if k < left:
+                node = node.left
+            elif k == left:
+                return node.data
+            else:
+                k -= left + 1
+                node = node.right
+
+    def count_range(self, lo, hi):      # O(height)
+        """Number of values v with lo <= v <= hi."""
+        if hi < lo:
+            return 0
+        return self._rank_le(hi) - self.rank(lo)
+
+    def floor(self, x):                 # O(height)
+        """Largest value <= x, or None."""
+        best = None
+        node = self.head
+        while node is not None:
+            if node.data == x:
+                return node.data
+            if node.data < x:
+                best = node.data
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def ceiling(self, x):               # O(height)
+        """Smallest value >= x, or None."""
+        best = None
+        node = self.head
+        while node is not None:
+            if node.data == x:
+                return node.data
+            if node.data > x:
+                best = node.data
+                node = node.left
+            else:
+                node = node.right
+        return best
 
     def clear(self):                    # O(1)
-        self.head = 0
+        self.head = None
         self.size = 0
     
     def pretty_print(self):
@@ -209,7 +360,7 @@ class BinaryTree:
         return self.size
     
     def __iter__(self):
-        return iter(self.inorder())
+        return self.iter_inorder()
     
     def __str__(self):
         return "BinaryTree(" + ", ".join(str(x) for x in self.inorder()) + ")"
\ No newline at end of file
@@ -0,0 +1,224 @@
+import time
+from functools import wraps
+
+from .doubly_linked_list import DoublyLinkedList
+
+_MISSING = object()
+_KWD_MARK = object()    # separates positional from keyword args in cached() keys
+
+
+class _Entry:
+    __slots__ = ("key", "value", "size", "expires", "freq", "node")
+
+    def __init__(self, key, value, size, expires):
+        self.key = key
+        self.value = value
+        self.size = size
+        self.expires = expires
+        self.freq = 1
+        self.node = None
+
+
+class Cache:
+    """
+    Bounded cache with O(1) get/put.
+
+    - capacity: limit on total entry size; each entry counts as 1 unless
+      size_fn(value) says otherwise
+    - policy="lru": one DoublyLinkedList, most recently used at the front
+    - policy="lfu": one DoublyLinkedList per access count, least recently
+      used evicted first among the least frequently used
+    - ttl: seconds an entry stays valid; expired entries are dropped
+      lazily when touched
+    """
+
+    def __init__(self, capacity=128, policy="lru", size_fn=None, ttl=None, timer=time.monotonic):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        if policy not in ("lru", "lfu"):
+            raise ValueError("policy must be 'lru' or 'lfu'.")
+
+        self.capacity = capacity
+        self.policy = policy
+        self._size_fn = size_fn
+        self._ttl = ttl
+        self._timer = timer
+
+        self._entries = {}
+        self._total = 0
+        self._order = DoublyLinkedList()    # lru
+        self._buckets = {}                  # lfu: freq -> DoublyLinkedList
+        self._min_freq = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def _expired(self, entry):
+        return entry.expires is not None and self._timer() >= entry.expires
+
+    def _link(self, entry):
+        if self.policy == "lru":
+            entry.node = self._order.prepend(entry)
+            return
+
+        bucket = self._buckets.get(entry.freq)
+        if bucket is None:
+            bucket = self._buckets[entry.freq] = DoublyLinkedList()
+        entry.node = bucket.prepend(entry)
+        if entry.freq < self._min_freq or self._min_freq == 0:
+            self._min_freq = entry.freq
+
+    def _unlink(self, entry):
+        if self.policy == "lru":
+            self._order.remove(entry.node)
+            return
+
+        # an emptied minimum bucket leaves _min_freq stale (never above the
+        # true minimum); _touch advances it, _evict_one recomputes it
+        bucket = self._buckets[entry.freq]
+        bucket.remove(entry.node)
+        if not bucket:
+            del self._buckets[entry.freq]
+
+    def _touch(self, entry):
+        if self.policy == "lru":
+            self._order.move_to_front(entry.node)
+            return
+
+        self._unlink(entry)
+        if entry.freq == self._min_freq and entry.freq not in self._buckets:
+            self._min_freq += 1
+        entry.freq += 1
+        self._link(entry)
+
+    def _drop(self, entry):
+        self._unlink(entry)
+        del self._entries[entry.key]
+        self._total -= entry.size
+
+    def _evict_one(self):
+        if self.policy == "lru":
+            victim = self._order.back().data
+        else:
+            if self._min_freq not in self._buckets:
+                self._min_freq = min(self._buckets)
+            victim = self._buckets[self._min_freq].back().data
+        self._drop(victim)
+        self.evictions += 1
+
+    def get(self, key, default=None):   # O(1)
+        entry = self._entries.get(key)
+        if entry is not None and self._expired(entry):
+            self._drop(entry)
+            self.expirations += 1
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._touch(entry)
+        return entry.value
+
+    def put(self, key, value):          # O(1) amortized
+        size = self._size_fn(value) if self._size_fn else 1
+        old = self._entries.get(key)
+        if old is not None:
+            self._drop(old)
+
+        if size > self.capacity:
+            # would evict everything and still not fit; leave it uncached
+            return
+
+        while self._total + size > self.capacity:
+            self._evict_one()
+
+        expires = None if self._ttl is None else self._timer() + self._ttl
+        entry = _Entry(key, value, size, expires)
+        if old is not None:
+            entry.freq = old.freq
+        self._entries[key] = entry
+        self._total += size
+        self._link(entry)
+
+    def delete(self, key):              # O(1)
+        entry = self._entries.get(key)
+        if entry is None:
+            raise KeyError(key)
+        self._drop(entry)
+
+    def clear(self):                    # O(1)
+        self._entries = {}
+        self._total = 0
+        self._order = DoublyLinkedList()
+        self._buckets = {}
+        self._min_freq = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "size": self._total,
+            "capacity": self.capacity,
+        }
+
+    def __contains__(self, key):
+        entry = self._entries.get(key)
+        return entry is not None and not self._expired(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"Cache(policy={self.policy!r}, entries={len(self._entries)}, size={self._total}/{self.capacity})"
+
+
+def cached(capacity=128, policy="lru", size_fn=None, ttl=None, key=None):
+    """
+    Memoize a function in a Cache keyed on its arguments. The wrapper
+    exposes the Cache as .cache and a .cache_clear() helper.
+
+    - key: optional key(*args, **kwargs) returning the hashable cache key,
+      e.g. to turn list arguments into tuples
+    - calls whose key is unhashable (lists, dicts, ...) skip the cache
+
+    Objects without __eq__/__hash__, such as Graph and Vector, are keyed by
+    identity, so a result goes stale if the object is mutated afterwards;
+    call cache_clear() or pass a key that captures the contents.
+
+    Wrapping a method keys on self too, so the cache keeps a reference to
+    every instance it has seen until that entry is evicted.
+    """
+    def decorator(func):
+        cache = Cache(capacity=capacity, policy=policy, size_fn=size_fn, ttl=ttl)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if key is not None:
+                k = key(*args, **kwargs)
+            else:
+                k = args + (_KWD_MARK,) + tuple(sorted(kwargs.items())) if kwargs else args
+            try:
+                hash(k)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            result = cache.get(k, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                cache.put(k, result)
+            return result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
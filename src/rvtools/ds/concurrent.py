@@ -0,0 +1,337 @@
+import asyncio
+import threading
+import time
+from collections import deque
+
+from .queue import Queue
+from .stack import Stack
+
+
+def _deadline(timeout):
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline):
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+class ConcurrentQueue:
+    """
+    Thread-safe Queue. enqueue/dequeue/peek keep Queue's non-blocking
+    semantics (IndexError when full or empty); put/get block, optionally
+    with a timeout that raises TimeoutError. Batch methods take the lock
+    once per batch.
+    """
+
+    def __init__(self, capacity=None, overflow="raise"):
+        self._queue = Queue(capacity, overflow)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def _has_room(self):
+        return self._queue.overflow == "overwrite" or not self._queue.is_full()
+
+    def _room(self):
+        if self._queue.capacity is None or self._queue.overflow == "overwrite":
+            return None
+        return self._queue.capacity - len(self._queue)
+
+    def enqueue(self, val):             # O(1)
+        with self._lock:
+            self._queue.enqueue(val)
+            self._not_empty.notify()
+
+    def enqueue_many(self, values):     # O(k)
+        values = list(values)
+        with self._lock:
+            self._queue.enqueue_many(values)
+            self._not_empty.notify(len(values))
+
+    def dequeue(self):                  # O(1)
+        with self._lock:
+            val = self._queue.dequeue()
+            self._not_full.notify()
+            return val
+
+    def dequeue_many(self, n):          # O(n)
+        with self._lock:
+            items = self._queue.dequeue_many(n)
+            self._not_full.notify(len(items))
+            return items
+
+    def peek(self):                     # O(1)
+        with self._lock:
+            return self._queue.peek()
+
+    def put(self, val, block=True, timeout=None):
+        with self._not_full:
+            if not block:
+                self._queue.enqueue(val)
+            elif not self._not_full.wait_for(self._has_room, timeout):
+                raise TimeoutError("Timed out waiting for room in the queue.")
+            else:
+                self._queue.enqueue(val)
+            self._not_empty.notify()
+
+    def put_many(self, values, timeout=None):
+        """
+        Enqueue all values, waiting for room as needed. Values go in as room
+        frees up, so a batch larger than the capacity can still complete.
+
+        Not atomic: on timeout the values already enqueued stay in the queue
+        (the first err.enqueued of them) and TimeoutError is raised.
+        """
+        values = list(values)
+        deadline = _deadline(timeout)
+        i = 0
+
+        with self._not_full:
+            while i < len(values):
+                if not self._not_full.wait_for(self._has_room, _remaining(deadline)):
+                    err = TimeoutError(
+                        f"Timed out waiting for room in the queue after enqueuing {i} of {len(values)} values."
+                    )
+                    err.enqueued = i
+                    raise err
+
+                room = self._room()
+                k = len(values) - i if room is None else min(room, len(values) - i)
+                self._queue.enqueue_many(values[i:i + k])
+                self._not_empty.notify(k)
+                i += k
+
+    def get(self, block=True, timeout=None):
+        with self._not_empty:
+            if block and not self._not_empty.wait_for(self.__len__, timeout):
+                raise TimeoutError("Timed out waiting for an item.")
+            val = self._queue.dequeue()
+            self._not_full.notify()
+            return val
+
+    def get_many(self, n, block=True, timeout=None):
+        """Wait for at least one item, then dequeue up to n."""
+        with self._not_empty:
+            if block and not self._not_empty.wait_for(self.__len__, timeout):
+                raise TimeoutError("Timed out waiting for an item.")
+            items = self._queue.dequeue_many(n)
+            self._not_full.notify(len(items))
+            return items
+
+    def is_empty(self):
+        return len(self._queue) == 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __repr__(self):
+        with self._lock:
+            return f"ConcurrentQueue({self._queue.to_list()})"
+
+
+class ConcurrentStack:
+    """
+    Thread-safe Stack. push/pop/peek keep Stack's semantics; get blocks
+    until an item is available, optionally with a timeout that raises
+    TimeoutError.
+    """
+
+    def __init__(self):
+        self._stack = Stack()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def push(self, val):                # O(1)
+        with self._lock:
+            self._stack.push(val)
+            self._not_empty.notify()
+
+    def put(self, val):
+        self.push(val)
+
+    def push_many(self, values):        # O(k)
+        values = list(values)
+        with self._lock:
+            self._stack.data.extend(values)
+            self._not_empty.notify(len(values))
+
+    def pop(self):                      # O(1)
+        with self._lock:
+            return self._stack.pop()
+
+    def pop_many(self, n):              # O(n)
+        """Pop up to n items, top of the stack first."""
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+        with self._lock:
+            data = self._stack.data
+            k = min(n, len(data))
+            items = data[len(data) - k:]
+            del data[len(data) - k:]
+        items.reverse()
+        return items
+
+    def peek(self):                     # O(1)
+        with self._lock:
+            return self._stack.peek()
+
+    def get(self, block=True, timeout=None):
+        with self._not_empty:
+            if block and not self._not_empty.wait_for(self.__len__, timeout):
+                raise TimeoutError("Timed out waiting for an item.")
+            return self._stack.pop()
+
+    def is_empty(self):
+        return len(self._stack) == 0
+
+    def __len__(self):
+        return len(self._stack)
+
+    def __repr__(self):
+        with self._lock:
+            return f"ConcurrentStack({self._stack.data})"
+
+
+class _AsyncWaiters:
+    # FIFO of futures parked until the container changes state
+
+    def __init__(self):
+        self._futures = deque()
+
+    def wake(self):
+        while self._futures:
+            fut = self._futures.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                return
+
+    async def wait(self, ready, timeout):
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while not ready():
+            fut = loop.create_future()
+            self._futures.append(fut)
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                await asyncio.wait_for(fut, remaining)
+            except BaseException as exc:
+                if fut.done() and not fut.cancelled():
+                    # woken but not resuming: hand the wakeup to the next waiter
+                    self.wake()
+                else:
+                    fut.cancel()
+                    try:
+                        self._futures.remove(fut)
+                    except ValueError:
+                        pass
+                if isinstance(exc, asyncio.TimeoutError):
+                    raise TimeoutError("Timed out waiting on the container.") from None
+                raise
+
+
+class AsyncQueue:
+    """
+    asyncio-aware Queue for use within a single event loop. enqueue/
+    dequeue/peek are the non-blocking Queue operations; await put/get
+    wait for room or an item, optionally with a timeout that raises
+    TimeoutError.
+    """
+
+    def __init__(self, capacity=None, overflow="raise"):
+        self._queue = Queue(capacity, overflow)
+        self._getters = _AsyncWaiters()
+        self._putters = _AsyncWaiters()
+
+    def _has_room(self):
+        return self._queue.overflow == "overwrite" or not self._queue.is_full()
+
+    def enqueue(self, val):             # O(1)
+        self._queue.enqueue(val)
+        self._getters.wake()
+
+    def enqueue_many(self, values):     # O(k)
+        values = list(values)
+        self._queue.enqueue_many(values)
+        for _ in values:
+            self._getters.wake()
+
+    def dequeue(self):                  # O(1)
+        val = self._queue.dequeue()
+        self._putters.wake()
+        return val
+
+    def dequeue_many(self, n):          # O(n)
+        items = self._queue.dequeue_many(n)
+        for _ in items:
+            self._putters.wake()
+        return items
+
+    def peek(self):                     # O(1)
+        return self._queue.peek()
+
+    async def put(self, val, timeout=None):
+        await self._putters.wait(self._has_room, timeout)
+        self.enqueue(val)
+
+    async def get(self, timeout=None):
+        await self._getters.wait(self.__len__, timeout)
+        return self.dequeue()
+
+    async def get_many(self, n, timeout=None):
+        """Wait for at least one item, then dequeue up to n."""
+        await self._getters.wait(self.__len__, timeout)
+        return self.dequeue_many(n)
+
+    def is_empty(self):
+        return len(self._queue) == 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def __repr__(self):
+        return f"AsyncQueue({self._queue.to_list()})"
+
+
+class AsyncStack:
+    """
+    asyncio-aware Stack for use within a single event loop. push/pop/peek
+    keep Stack's semantics; await get waits for an item, optionally with a
+    timeout that raises TimeoutError.
+    """
+
+    def __init__(self):
+        self._stack = Stack()
+        self._getters = _AsyncWaiters()
+
+    def push(self, val):                # O(1)
+        self._stack.push(val)
+        self._getters.wake()
+
+    async def put(self, val):
+        self.push(val)
+
+    def push_many(self, values):        # O(k)
+        values = list(values)
+        self._stack.data.extend(values)
+        for _ in values:
+            self._getters.wake()
+
+    def pop(self):                      # O(1)
+        return self._stack.pop()
+
+    def peek(self):                     # O(1)
+        return self._stack.peek()
+
+    async def get(self, timeout=None):
+        await self._getters.wait(self.__len__, timeout)
+        return self._stack.pop()
+
+    def is_empty(self):
+        return len(self._stack) == 0
+
+    def __len__(self):
+        return len(self._stack)
+
+    def __repr__(self):
+        return f"AsyncStack({self._stack.data})"
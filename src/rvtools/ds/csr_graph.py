@@ -0,0 +1,257 @@
+from array import array
+
+from .._parallel import imap_with_state
+
+
+def _as_long_array(values):
+    if isinstance(values, array) and values.typecode == "l":
+        return values
+    return array("l", values)
+
+
+class CSRGraph:
+    """
+    Immutable compressed-sparse-row snapshot of a Graph.
+
+    Vertex ids are mapped to dense integers 0..V-1 (in Graph insertion
+    order). Outgoing neighbors of vertex i are
+    targets[offsets[i]:offsets[i+1]]; the optional reverse CSR holds the
+    incoming neighbors the same way. Build one with Graph.freeze().
+    """
+
+    __slots__ = (
+        "directed",
+        "_ids",
+        "_index",
+        "_offsets",
+        "_targets",
+        "_in_offsets",
+        "_in_targets",
+    )
+
+    def __init__(self, ids, offsets, targets, in_offsets=None, in_targets=None, directed=False):
+        if len(offsets) != len(ids) + 1:
+            raise ValueError("offsets must have one entry per vertex plus one.")
+        if (in_offsets is None) != (in_targets is None):
+            raise ValueError("in_offsets and in_targets must be given together.")
+
+        self.directed = directed
+        self._ids = tuple(ids)
+        self._index = {vid: i for i, vid in enumerate(self._ids)}
+        self._offsets = _as_long_array(offsets)
+        self._targets = _as_long_array(targets)
+
+        if in_offsets is None:
+            self._in_offsets = None
+            self._in_targets = None
+        else:
+            self._in_offsets = _as_long_array(in_offsets)
+            self._in_targets = _as_long_array(in_targets)
+
+    @classmethod
+    def from_graph(cls, graph, reverse=True):  # O(V+E)
+        ids = list(graph.vertices)
+        index = {vid: i for i, vid in enumerate(ids)}
+
+        def _build(adj):
+            offsets = array("l", [0])
+            targets = array("l")
+            for vid in ids:
+                targets.extend([index[nid] for nid in adj[vid]])
+                offsets.append(len(targets))
+            return offsets, targets
+
+        offsets, targets = _build(graph._out)
+
+        in_offsets = in_targets = None
+        if reverse:
+            if graph.directed:
+                in_offsets, in_targets = _build(graph._in)
+            else:
+                # undirected adjacency is symmetric, so the reverse CSR is identical
+                in_offsets, in_targets = offsets, targets
+
+        return cls(ids, offsets, targets, in_offsets, in_targets, graph.directed)
+
+    @property
+    def ids(self):
+        return self._ids
+
+    @property
+    def num_vertices(self):
+        return len(self._ids)
+
+    @property
+    def num_edges(self):
+        return len(self._targets)
+
+    @property
+    def has_reverse(self):
+        return self._in_offsets is not None
+
+    def index(self, id):                # O(1)
+        try:
+            return self._index[id]
+        except KeyError:
+            raise ValueError(f"Vertex '{id}' Not Found.") from None
+
+    def outgoing(self, id):             # O(deg)
+        i = self.index(id)
+        ids = self._ids
+        return [ids[j] for j in self._targets[self._offsets[i]:self._offsets[i + 1]]]
+
+    def following(self, id):
+        return self.outgoing(id)
+
+    def incoming(self, id):             # O(deg)
+        if self._in_offsets is None:
+            raise ValueError("Snapshot was frozen without a reverse CSR.")
+        i = self.index(id)
+        ids = self._ids
+        return [ids[j] for j in self._in_targets[self._in_offsets[i]:self._in_offsets[i + 1]]]
+
+    def followers(self, id):
+        return self.incoming(id)
+
+    def bfs(self, start_id):            # O(V+E)
+        start = self._index.get(start_id)
+        if start is None:
+            return []
+
+        offsets = self._offsets
+        targets = self._targets
+        visited = bytearray(len(self._ids))
+        visited[start] = 1
+
+        queue = array("l", [start])
+        front = 0
+
+        while front < len(queue):
+            v = queue[front]
+            front += 1
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if not visited[w]:
+                    visited[w] = 1
+                    queue.append(w)
+
+        ids = self._ids
+        return [ids[v] for v in queue]
+
+    def dfs(self, start_id):            # O(V+E)
+        start = self._index.get(start_id)
+        if start is None:
+            return []
+
+        offsets = self._offsets
+        targets = self._targets
+        visited = bytearray(len(self._ids))
+        order = []
+        stack = [start]
+
+        while stack:
+            v = stack.pop()
+            if visited[v]:
+                continue
+
+            visited[v] = 1
+            order.append(v)
+
+            for w in reversed(targets[offsets[v]:offsets[v + 1]]):
+                if not visited[w]:
+                    stack.append(w)
+
+        ids = self._ids
+        return [ids[v] for v in order]
+
+    def shortest_path_bfs(self, start_id, goal_id): # O(V+E)
+        start = self._index.get(start_id)
+        goal = self._index.get(goal_id)
+        if start is None or goal is None:
+            return []
+
+        offsets = self._offsets
+        targets = self._targets
+        parent = array("l", [-1]) * len(self._ids)
+        parent[start] = start
+
+        queue = array("l", [start])
+        front = 0
+        found = False
+
+        while front < len(queue):
+            v = queue[front]
+            front += 1
+
+            if v == goal:
+                found = True
+                break
+
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if parent[w] == -1:
+                    parent[w] = v
+                    queue.append(w)
+
+        if not found:
+            return []
+
+        ids = self._ids
+        path = [ids[goal]]
+        cur = goal
+        while cur != start:
+            cur = parent[cur]
+            path.append(ids[cur])
+        path.reverse()
+        return path
+
+    def bfs_distances(self, start_id):  # O(V+E)
+        """
+        Hop distances from start_id as an array('l') aligned with ids;
+        unreachable vertices hold -1.
+        """
+        return self._distances(self.index(start_id))
+
+    def _distances(self, start):
+        offsets = self._offsets
+        targets = self._targets
+        dist = array("l", [-1]) * len(self._ids)
+        dist[start] = 0
+
+        queue = array("l", [start])
+        front = 0
+
+        while front < len(queue):
+            v = queue[front]
+            front += 1
+            d = dist[v] + 1
+            for w in targets[offsets[v]:offsets[v + 1]]:
+                if dist[w] == -1:
+                    dist[w] = d
+                    queue.append(w)
+
+        return dist
+
+    def bfs_many(self, sources, workers=1, chunksize=None):
+        """
+        Yields (source_id, row) for each source, in order, where row is the
+        bfs_distances() array for that source.
+
+        With workers > 1 (None means one per CPU) the rows are computed by a
+        multiprocessing pool. The snapshot is shipped to each worker once at
+        start-up, so only source indices and result rows cross process
+        boundaries.
+        """
+        sources = list(sources)
+        indices = [self.index(sid) for sid in sources]
+
+        rows = imap_with_state(CSRGraph._distances, self, indices, workers, chunksize)
+        for sid, row in zip(sources, rows):
+            yield sid, row
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, id):
+        return id in self._index
+
+    def __repr__(self):
+        return f"CSRGraph(directed={self.directed}, vertices={len(self._ids)}, edges={len(self._targets)})"
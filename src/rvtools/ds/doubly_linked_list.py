@@ -0,0 +1,162 @@
+class DLLNode:
+    __slots__ = ("data", "prev", "next", "owner")
+
+    def __init__(self, data):
+        self.data = data
+        self.prev: DLLNode = None
+        self.next: DLLNode = None
+        self.owner = None               # token of the list holding this node
+
+    def __repr__(self):
+        return f"DLLNode({self.data})"
+
+
+class DoublyLinkedList:
+    """
+    Doubly linked list between two sentinel nodes. Insertions return the
+    new node, which can later be passed back as a handle for O(1) removal
+    or reordering. Passing a handle that belongs to another list (or was
+    removed, or dropped by clear()) raises ValueError.
+    """
+
+    def __init__(self):
+        self._head = DLLNode(None)      # sentinel before the first node
+        self._tail = DLLNode(None)      # sentinel after the last node
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._token = object()          # replaced by clear() to orphan old nodes
+        self.size = 0
+
+    def _check(self, node):
+        if node.owner is not self._token:
+            raise ValueError("Node does not belong to this list.")
+
+    def _link_after(self, prev, node):
+        nxt = prev.next
+        node.prev = prev
+        node.next = nxt
+        node.owner = self._token
+        prev.next = node
+        nxt.prev = node
+        self.size += 1
+
+    def _unlink(self, node):
+        self._check(node)
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = None
+        node.next = None
+        node.owner = None
+        self.size -= 1
+
+    def append(self, data):             # O(1)
+        node = DLLNode(data)
+        self._link_after(self._tail.prev, node)
+        return node
+
+    def prepend(self, data):            # O(1)
+        node = DLLNode(data)
+        self._link_after(self._head, node)
+        return node
+
+    def insert_after(self, node, data): # O(1)
+        self._check(node)
+        new_node = DLLNode(data)
+        self._link_after(node, new_node)
+        return new_node
+
+    def insert_before(self, node, data): # O(1)
+        self._check(node)
+        new_node = DLLNode(data)
+        self._link_after(node.prev, new_node)
+        return new_node
+
+    def remove(self, node):             # O(1)
+        self._unlink(node)
+        return node.data
+
+    def move_to_front(self, node):      # O(1)
+        self._check(node)
+        if self._head.next is node:
+            return
+        self._unlink(node)
+        self._link_after(self._head, node)
+
+    def move_to_back(self, node):       # O(1)
+        self._check(node)
+        if self._tail.prev is node:
+            return
+        self._unlink(node)
+        self._link_after(self._tail.prev, node)
+
+    def pop_front(self):                # O(1)
+        if self.size == 0:
+            raise IndexError("List is Empty.")
+        return self.remove(self._head.next)
+
+    def pop_back(self):                 # O(1)
+        if self.size == 0:
+            raise IndexError("List is Empty.")
+        return self.remove(self._tail.prev)
+
+    def front(self):                    # O(1)
+        """First node handle, or None if empty."""
+        return self._head.next if self.size else None
+
+    def back(self):                     # O(1)
+        """Last node handle, or None if empty."""
+        return self._tail.prev if self.size else None
+
+    def find(self, val):                # O(n)
+        """Node handle of the first node holding val, or None."""
+        current = self._head.next
+        while current is not self._tail:
+            if current.data == val:
+                return current
+            current = current.next
+        return None
+
+    def contains_val(self, val):        # O(n)
+        return self.find(val) is not None
+
+    def delete_val(self, val):          # O(n)
+        node = self.find(val)
+        if node is not None:
+            self._unlink(node)
+
+    def to_list(self):                  # O(n)
+        return list(self)
+
+    def from_list(self, values):        # O(n)
+        for v in values:
+            self.append(v)
+
+    def is_empty(self):
+        return self.size == 0
+
+    def clear(self):                    # O(1)
+        self._head.next = self._tail
+        self._tail.prev = self._head
+        self._token = object()
+        self.size = 0
+
+    def __contains__(self, val):
+        return self.contains_val(val)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self._head.next
+        while current is not self._tail:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        current = self._tail.prev
+        while current is not self._head:
+            yield current.data
+            current = current.prev
+
+    def __str__(self):
+        return " <-> ".join(["None", *(str(x) for x in self), "None"])
@@ -1,3 +1,11 @@
+import csv
+import heapq
+from itertools import count
+
+from .csr_graph import CSRGraph
+from .union_find import UnionFind
+
+
 class Vertex:
     def __init__(self, id, data=None):
         self.id = id
@@ -7,71 +15,207 @@ class Vertex:
         return f"Vertex({self.id}, data={self.data})"
 
 class Edge:
-    def __init__(self, start, end):
+    def __init__(self, start, end, weight=1):
         self.start = start
         self.end = end
+        self.weight = weight
     
     def __repr__(self):
+        if self.weight != 1:
+            return f"Edge({self.start.id} -> {self.end.id}, weight={self.weight})"
         return f"Edge({self.start.id} -> {self.end.id})"
 
 
 class Graph:
     def __init__(self, directed=False):
         self.vertices = {}
-        self.edges = []
         self.directed = directed
+        self._edges = []                # Edge objects, or None until first requested
+        self._pending = {}              # (start id, slot in _out[start]) -> Edge made while _edges is None
+        self._edge_count = 0
+        self._out = {}                  # id -> [neighbor id, ...]
+        self._out_w = {}                # id -> [edge weight, ...] parallel to _out
+        self._in = {}                   # id -> [predecessor id, ...]
 
     def add_vertex(self, id, data=None):# O(1)
         if id not in self.vertices:
             v = Vertex(id, data)
             self.vertices[id] = v
+            self._out[id] = []
+            self._out_w[id] = []
+            self._in[id] = []
         return self.vertices[id]
+
+    @classmethod
+    def from_edges(cls, edges, directed=False, keep_edges=False): # O(V+E)
+        """
+        Build a graph from an iterable of (start, end) or (start, end, weight)
+        tuples, creating vertices as they appear.
+
+        Adjacency is filled directly; Edge objects are only built if
+        keep_edges is True; otherwise the edges list is materialized from
+        the adjacency index the first time it is accessed.
+        """
+        g = cls(directed=directed)
+        vertices = g.vertices
+        out, out_w, inc = g._out, g._out_w, g._in
+        edge_list = [] if keep_edges else None
+        n = 0
+
+        for item in edges:
+            if len(item) == 3:
+                start, end, weight = item
+            else:
+                start, end = item
+                weight = 1
+
+            if start not in vertices:
+                g.add_vertex(start)
+            if end not in vertices:
+                g.add_vertex(end)
+
+            out[start].append(end)
+            out_w[start].append(weight)
+            inc[end].append(start)
+            n += 1
+
+            if not directed:
+                out[end].append(start)
+                out_w[end].append(weight)
+                inc[start].append(end)
+                n += 1
+
+            if keep_edges:
+                edge_list.append(Edge(vertices[start], vertices[end], weight))
+                if not directed:
+                    edge_list.append(Edge(vertices[end], vertices[start], weight))
+
+        g._edges = edge_list
+        g._edge_count = n
+        return g
+
+    @classmethod
+    def from_file(cls, path, directed=False, delimiter=None, vertex_type=str,
+                  comment="#", skip_header=False, keep_edges=False, encoding="utf-8"):
+        """
+        Stream an edge-list file into a graph. Each line holds
+        "start end [weight]"; weights are parsed as floats and ids with
+        vertex_type.
+
+        delimiter defaults to "," for .csv files (parsed with the csv
+        module), tab for .tsv files and any whitespace otherwise. Blank
+        lines and lines starting with comment are skipped.
+        """
+        if delimiter is None:
+            lower = str(path).lower()
+            if lower.endswith(".csv"):
+                delimiter = ","
+            elif lower.endswith(".tsv"):
+                delimiter = "\t"
+
+        def _rows(f):
+            if delimiter == ",":
+                reader = csv.reader(f)
+            else:
+                reader = (line.split(delimiter) for line in f)
+
+            lineno = 0
+            for row in reader:
+                lineno += 1
+                if skip_header and lineno == 1:
+                    continue
+                if not row or not row[0].strip() or (comment and row[0].lstrip().startswith(comment)):
+                    continue
+                if len(row) == 2:
+                    yield vertex_type(row[0].strip()), vertex_type(row[1].strip())
+                elif len(row) == 3:
+                    yield vertex_type(row[0].strip()), vertex_type(row[1].strip()), float(row[2])
+                else:
+                    raise ValueError(f"Line {lineno}: expected 2 or 3 fields, got {len(row)}.")
+
+        with open(path, newline="", encoding=encoding) as f:
+            return cls.from_edges(_rows(f), directed=directed, keep_edges=keep_edges)
+
+    @property
+    def edges(self):                    # O(1) amortized
+        if self._edges is None:
+            vertices = self.vertices
+            pending = self._pending
+            edges = []
+            for vid, v in vertices.items():
+                for k, (nid, w) in enumerate(zip(self._out[vid], self._out_w[vid])):
+                    e = pending.get((vid, k)) if pending else None
+                    edges.append(e if e is not None else Edge(v, vertices[nid], w))
+            self._edges = edges
+            self._pending = {}
+        return self._edges
     
-    def add_edge(self, start, end):     # O(1)
+    def add_edge(self, start, end, weight=1): # O(1) amortized
         if start not in self.vertices:
             raise ValueError(f"Start Vertex '{start}' Not Found.")
         if end not in self.vertices:
             raise ValueError(f"End Vertex '{end}' Not Found.")
         
-        e = Edge(self.vertices[start], self.vertices[end])
-        self.edges.append(e)
+        # on a bulk-loaded graph the Edge waits in _pending, keyed by its
+        # adjacency slot, so .edges later hands back this same object
+        edges = self._edges
+        e = Edge(self.vertices[start], self.vertices[end], weight)
+        if edges is None:
+            self._pending[start, len(self._out[start])] = e
+        else:
+            edges.append(e)
+        self._edge_count += 1
+        self._out[start].append(end)
+        self._out_w[start].append(weight)
+        self._in[end].append(start)
 
         if not self.directed:
-            e_rev = Edge(self.vertices[end], self.vertices[start])
-            self.edges.append(e_rev)
+            e_rev = Edge(self.vertices[end], self.vertices[start], weight)
+            if edges is None:
+                self._pending[end, len(self._out[end])] = e_rev
+            else:
+                edges.append(e_rev)
+            self._edge_count += 1
+            self._out[end].append(start)
+            self._out_w[end].append(weight)
+            self._in[start].append(end)
         
         return e
     
-    def outgoing(self, id):             # O(E)
+    def outgoing(self, id):             # O(deg)
         if id not in self.vertices:
             raise ValueError(f"Vertex '{id}' Not Found.")
-        return [e.end for e in self.edges if e.start.id == id]
+        vertices = self.vertices
+        return [vertices[nid] for nid in self._out[id]]
     
     def following(self, id):
         return self.outgoing(id)
     
-    def incoming(self, id):             # O(E)
+    def incoming(self, id):             # O(deg)
         if id not in self.vertices:
             raise ValueError(f"Vertex '{id}' Not Found.")
-        return [e.start for e in self.edges if e.end.id == id]
+        vertices = self.vertices
+        return [vertices[pid] for pid in self._in[id]]
     
     def followers(self, id):
         return self.incoming(id)
     
-    def connections(self, id):          # O(E)
+    def connections(self, id):          # O(deg)
         inc = self.incoming(id)
         out = self.outgoing(id)
 
-        combined = inc + [v for v in out if v not in inc]
+        seen = {v.id for v in inc}
+        combined = inc + [v for v in out if v.id not in seen]
         return combined
     
     def neighbors(self, id):
         return self.connections(id)
     
-    def bfs(self, start_id):            # O(V*E)
+    def bfs(self, start_id):            # O(V+E)
         if start_id not in self.vertices:
             return []
         
+        adj = self._out
         visited = set()
         order = []
 
@@ -84,18 +228,18 @@ class Graph:
             front += 1
             order.append(vid)
 
-            for neighbor_vertex in self.outgoing(vid):
-                nid = neighbor_vertex.id
+            for nid in adj[vid]:
                 if nid not in visited:
                     visited.add(nid)
                     queue.append(nid)
             
         return order
 
-    def dfs(self, start_id):            # O(V*E)
+    def dfs(self, start_id):            # O(V+E)
         if start_id not in self.vertices:
             return []
         
+        adj = self._out
         visited = set()
         order = []
         stack = [start_id]
@@ -108,19 +252,21 @@ class Graph:
             visited.add(vid)
             order.append(vid)
 
-            neighbors = self.outgoing(vid)
-            for neighbor_vertex in reversed(neighbors):
-                nid = neighbor_vertex.id
+            for nid in reversed(adj[vid]):
                 if nid not in visited:
                     stack.append(nid)
         
         return order
     
-    def shortest_path_bfs(self, start_id, goal_id): # O(V*E)
+    def shortest_path_bfs(self, start_id, goal_id, bidirectional=False): # O(V+E)
 
         if start_id not in self.vertices or goal_id not in self.vertices:
             return []
+
+        if bidirectional:
+            return self._bidirectional_bfs(start_id, goal_id)
         
+        adj = self._out
         from_parent = {start_id: None}
         visited = set([start_id])
 
@@ -137,8 +283,7 @@ class Graph:
                 found = True
                 break
 
-            for neighbor_vertex in self.outgoing(vid):
-                nid = neighbor_vertex.id
+            for nid in adj[vid]:
                 if nid not in visited:
                     visited.add(nid)
                     from_parent[nid] = vid
@@ -155,7 +300,290 @@ class Graph:
         path.reverse()
         return path
     
+    def _bidirectional_bfs(self, start_id, goal_id):
+        if start_id == goal_id:
+            return [start_id]
+
+        # forward search follows outgoing edges, backward search follows incoming
+        fwd_parent = {start_id: None}
+        bwd_parent = {goal_id: None}
+        fwd_frontier = [start_id]
+        bwd_frontier = [goal_id]
+
+        while fwd_frontier and bwd_frontier:
+            # expand the smaller frontier one full level at a time
+            if len(fwd_frontier) <= len(bwd_frontier):
+                frontier, adj = fwd_frontier, self._out
+                parent, other = fwd_parent, bwd_parent
+            else:
+                frontier, adj = bwd_frontier, self._in
+                parent, other = bwd_parent, fwd_parent
+
+            next_frontier = []
+            meet = None
+            for vid in frontier:
+                for nid in adj[vid]:
+                    if nid in parent:
+                        continue
+                    parent[nid] = vid
+                    if nid in other:
+                        meet = nid
+                        break
+                    next_frontier.append(nid)
+                if meet is not None:
+                    break
+
+            if meet is not None:
+                path = self._build_path(fwd_parent, meet)
+                cur = bwd_parent[meet]
+                while cur is not None:
+                    path.append(cur)
+                    cur = bwd_parent[cur]
+                return path
+
+            if frontier is fwd_frontier:
+                fwd_frontier = next_frontier
+            else:
+                bwd_frontier = next_frontier
+
+        return []
+
+    def multi_source_bfs(self, sources, goal_id=None): # O(V+E)
+        """
+        BFS seeded from every vertex in sources at once.
+
+        With no goal, returns {id: hops to the nearest source} for every
+        reachable vertex. With a goal, returns the shortest path to it from
+        whichever source is nearest, or [] if none reaches it. Unknown
+        source ids are ignored.
+        """
+        adj = self._out
+        dist = {}
+        from_parent = {}
+        queue = []
+
+        for sid in sources:
+            if sid in self.vertices and sid not in dist:
+                dist[sid] = 0
+                from_parent[sid] = None
+                queue.append(sid)
+
+        if goal_id is not None and goal_id not in self.vertices:
+            return []
+
+        front = 0
+        found = False
+
+        while front < len(queue):
+            vid = queue[front]
+            front += 1
+
+            if vid == goal_id:
+                found = True
+                break
+
+            d = dist[vid] + 1
+            for nid in adj[vid]:
+                if nid not in dist:
+                    dist[nid] = d
+                    from_parent[nid] = vid
+                    queue.append(nid)
+
+        if goal_id is None:
+            return dist
+        if not found:
+            return []
+        return self._build_path(from_parent, goal_id)
+
+    def dijkstra(self, start_id, goal_id=None): # O((V+E) log V)
+        """
+        Weighted shortest paths from start_id over non-negative edge weights.
+
+        With no goal, returns {id: distance} for every reachable vertex.
+        With a goal, stops as soon as it is settled and returns
+        (path, cost), or ([], inf) if the goal is unreachable.
+        """
+        if start_id not in self.vertices or (goal_id is not None and goal_id not in self.vertices):
+            return {} if goal_id is None else ([], float("inf"))
+
+        dist, parent = self._heap_search(start_id, goal_id, None)
+
+        if goal_id is None:
+            return dist
+        if goal_id not in dist:
+            return [], float("inf")
+        return self._build_path(parent, goal_id), dist[goal_id]
+
+    def astar(self, start_id, goal_id, heuristic): # O((V+E) log V)
+        """
+        A* search from start_id to goal_id. heuristic(id, goal_id) must
+        never overestimate the remaining cost. Vertices are reopened when a
+        cheaper path to them turns up, so a heuristic that is admissible
+        but not consistent still gives optimal paths (at the price of
+        extra expansions). Returns (path, cost), or ([], inf) if the goal
+        is unreachable.
+        """
+        if start_id not in self.vertices or goal_id not in self.vertices:
+            return [], float("inf")
+
+        dist, parent = self._heap_search(start_id, goal_id, heuristic)
+
+        if goal_id not in dist:
+            return [], float("inf")
+        return self._build_path(parent, goal_id), dist[goal_id]
+
+    def _heap_search(self, start_id, goal_id, heuristic):
+        adj = self._out
+        adj_w = self._out_w
+        tie = count()                   # keeps heap entries comparable for any id type
+
+        dist = {start_id: 0}
+        parent = {start_id: None}
+
+        h = heuristic(start_id, goal_id) if heuristic else 0
+        heap = [(h, next(tie), 0, start_id)]
+
+        while heap:
+            _, _, d, vid = heapq.heappop(heap)
+            if d > dist[vid]:
+                continue                # stale entry, a cheaper one was pushed
+
+            if vid == goal_id:
+                break
+
+            # no closed set: a vertex is expanded again whenever its
+            # distance improves, which A* needs with inconsistent heuristics
+            for nid, w in zip(adj[vid], adj_w[vid]):
+                if w < 0:
+                    raise ValueError(f"Negative edge weight {w} on '{vid}' -> '{nid}'.")
+                nd = d + w
+                if nid not in dist or nd < dist[nid]:
+                    dist[nid] = nd
+                    parent[nid] = vid
+                    h = heuristic(nid, goal_id) if heuristic else 0
+                    heapq.heappush(heap, (nd + h, next(tie), nd, nid))
+
+        # the heap only empties or breaks on the goal, so every entry left
+        # in dist that matters to the caller is final
+        return dist, parent
+
+    @staticmethod
+    def _build_path(parent, goal_id):
+        path = []
+        cur = goal_id
+        while cur is not None:
+            path.append(cur)
+            cur = parent[cur]
+        path.reverse()
+        return path
+
+    def connected_components(self):    # O(V+E)
+        """
+        Connected components as lists of ids (weakly connected for
+        directed graphs), ordered by first vertex insertion.
+        """
+        uf = UnionFind(self.vertices)
+        for vid, nbrs in self._out.items():
+            for nid in nbrs:
+                uf.union(vid, nid)
+        return uf.groups()
+
+    def topological_sort(self):         # O(V+E)
+        """Kahn's algorithm. Raises ValueError if the graph has a cycle."""
+        if not self.directed:
+            raise ValueError("topological_sort requires a directed graph.")
+
+        adj = self._out
+        indegree = {vid: len(preds) for vid, preds in self._in.items()}
+        queue = [vid for vid, d in indegree.items() if d == 0]
+        front = 0
+
+        while front < len(queue):
+            vid = queue[front]
+            front += 1
+            for nid in adj[vid]:
+                indegree[nid] -= 1
+                if indegree[nid] == 0:
+                    queue.append(nid)
+
+        if len(queue) != len(self.vertices):
+            raise ValueError("Graph contains a cycle.")
+        return queue
+
+    def strongly_connected_components(self): # O(V+E)
+        """
+        Tarjan's algorithm with an explicit stack, so deep graphs cannot hit
+        the recursion limit. Components come out in reverse topological
+        order of the condensation.
+        """
+        adj = self._out
+        index = {}
+        low = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self.vertices:
+            if root in index:
+                continue
+
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj[root]))]
+
+            while work:
+                vid, nbrs = work[-1]
+                for nid in nbrs:
+                    if nid not in index:
+                        index[nid] = low[nid] = counter
+                        counter += 1
+                        stack.append(nid)
+                        on_stack.add(nid)
+                        work.append((nid, iter(adj[nid])))
+                        break
+                    elif nid in on_stack and index[nid] < low[vid]:
+                        low[vid] = index[nid]
+                else:
+                    # every neighbor of vid has been explored
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if low[vid] < low[parent]:
+                            low[parent] = low[vid]
+
+                    if low[vid] == index[vid]:
+                        component = []
+                        while True:
+                            nid = stack.pop()
+                            on_stack.discard(nid)
+                            component.append(nid)
+                            if nid == vid:
+                                break
+                        components.append(component)
+
+        return components
+
+    def bfs_many(self, sources, workers=1, chunksize=None):
+        """
+        BFS hop distances from many sources, optionally across a process
+        pool. Yields (source_id, row) in source order, where row[i] is the
+        distance to the i-th vertex of self.vertices, or -1 if unreachable.
+        See CSRGraph.bfs_many.
+        """
+        snapshot = self.freeze(reverse=False)
+        return snapshot.bfs_many(sources, workers=workers, chunksize=chunksize)
+
+    def freeze(self, reverse=True):    # O(V+E)
+        """
+        Immutable CSR snapshot for read-heavy traversal. Pass reverse=False
+        to skip the reverse CSR when incoming() is not needed.
+        """
+        return CSRGraph.from_graph(self, reverse=reverse)
+
     def __repr__(self):
-        return f"Graph(directed={self.directed}, vertices={list(self.vertices.keys())}, edges={len(self.edges)})"
+        return f"Graph(directed={self.directed}, vertices={list(self.vertices.keys())}, edges={self._edge_count})"
         
 
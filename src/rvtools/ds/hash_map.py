@@ -1,7 +1,69 @@
+_MISSING = object()
+
+
+def _is_index(value):
+    # bool is an int subclass, but True/False are not ids
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
 class HashMap:
-    def __init__(self):
+    """
+    Two-way key <-> value map.
+
+    With compact=True, values must be non-negative ints (e.g. interned
+    ids) and the value -> key side is a plain list indexed by value
+    instead of a second dict, which is much smaller for dense ids.
+    """
+
+    def __init__(self, compact=False):
+        self._compact = compact
         self._key_to_val = {}
-        self._val_to_key = {}
+        self._val_to_key = [] if compact else {}
+
+    @classmethod
+    def from_pairs(cls, pairs, compact=False): # O(n)
+        """Build from (key, value) pairs, checking uniqueness in bulk."""
+        hm = cls(compact=compact)
+        n = 0
+
+        def _counted():
+            nonlocal n
+            for pair in pairs:
+                n += 1
+                yield pair
+
+        key_to_val = dict(_counted())
+        if len(key_to_val) != n:
+            raise KeyError("Duplicate keys in pairs.")
+
+        if compact:
+            vals = key_to_val.values()
+            if vals and not all(map(_is_index, vals)):
+                raise ValueError("compact HashMap values must be non-negative ints.")
+            rev = [_MISSING] * (max(vals) + 1 if vals else 0)
+            for k, v in key_to_val.items():
+                if rev[v] is not _MISSING:
+                    raise KeyError(f"Value {v} already exists.")
+                rev[v] = k
+        else:
+            rev = {v: k for k, v in key_to_val.items()}
+            if len(rev) != len(key_to_val):
+                raise KeyError("Duplicate values in pairs.")
+            if None in rev:
+                raise ValueError("Values cannot be None.")
+
+        hm._key_to_val = key_to_val
+        hm._val_to_key = rev
+        return hm
+
+    def _has_val(self, value):
+        if self._compact:
+            return (
+                _is_index(value)
+                and value < len(self._val_to_key)
+                and self._val_to_key[value] is not _MISSING
+            )
+        return value in self._val_to_key
 
     def append(self, key, value=None):
         if value is None and isinstance(key, tuple):
@@ -12,30 +74,58 @@ class HashMap:
         if value is None:
             raise ValueError("append expects either (key, value) or key, value")
 
+        if self._compact and not _is_index(value):
+            raise ValueError("compact HashMap values must be non-negative ints.")
+
         if key in self._key_to_val:
             raise KeyError(f"Key {key} already exists.")
-        if value in self._val_to_key:
+        if self._has_val(value):
             raise KeyError(f"Value {value} already exists.")
 
         self._key_to_val[key] = value
-        self._val_to_key[value] = key
+        if self._compact:
+            rev = self._val_to_key
+            if value >= len(rev):
+                rev.extend([_MISSING] * (value + 1 - len(rev)))
+            rev[value] = key
+        else:
+            self._val_to_key[value] = key
 
     def get_val(self, key):
         return self._key_to_val.get(key)
 
     def get_key(self, value):
+        if self._compact:
+            if not self._has_val(value):
+                return None
+            return self._val_to_key[value]
         return self._val_to_key.get(value)
 
+    def get_vals(self, keys):           # O(k)
+        return list(map(self._key_to_val.get, keys))
+
+    def get_keys(self, values):         # O(k)
+        if self._compact:
+            return [self.get_key(v) for v in values]
+        return list(map(self._val_to_key.get, values))
+
     def remove_key(self, key):
         if key not in self._key_to_val:
             raise KeyError(key)
         value = self._key_to_val.pop(key)
-        self._val_to_key.pop(value)
+        if self._compact:
+            self._val_to_key[value] = _MISSING
+        else:
+            self._val_to_key.pop(value)
 
     def remove_val(self, value):
-        if value not in self._val_to_key:
+        if not self._has_val(value):
             raise KeyError(value)
-        key = self._val_to_key.pop(value)
+        if self._compact:
+            key = self._val_to_key[value]
+            self._val_to_key[value] = _MISSING
+        else:
+            key = self._val_to_key.pop(value)
         self._key_to_val.pop(key)
 
     def __len__(self):
@@ -45,13 +135,13 @@ class HashMap:
         return key in self._key_to_val
 
     def keys(self):
-        return list(self._key_to_val.keys())
+        return self._key_to_val.keys()
 
     def values(self):
-        return list(self._key_to_val.values())
+        return self._key_to_val.values()
 
     def items(self):
-        return list(self._key_to_val.items())
+        return self._key_to_val.items()
 
     def __repr__(self):
-        return f"HashMap({self._key_to_val})"
\ No newline at end of file
+        return f"HashMap({self._key_to_val})"
@@ -0,0 +1,258 @@
+_EMPTY = object()
+_TOMBSTONE = object()
+
+
+class _Table:
+    # one linear-probing table over parallel key / value / hash arrays
+    __slots__ = ("keys", "vals", "hashes", "mask", "live", "tombstones")
+
+    def __init__(self, capacity):
+        self.keys = [_EMPTY] * capacity
+        self.vals = [None] * capacity
+        self.hashes = [0] * capacity
+        self.mask = capacity - 1
+        self.live = 0
+        self.tombstones = 0
+
+    def find(self, key, h):
+        keys = self.keys
+        hashes = self.hashes
+        mask = self.mask
+        i = h & mask
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                return -1
+            if k is not _TOMBSTONE and hashes[i] == h and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    def insert_new(self, key, h, val):
+        # caller guarantees key is absent; the first free slot (empty or
+        # tombstone) on its probe path takes it
+        keys = self.keys
+        mask = self.mask
+        i = h & mask
+        while keys[i] is not _EMPTY and keys[i] is not _TOMBSTONE:
+            i = (i + 1) & mask
+
+        if keys[i] is _TOMBSTONE:
+            self.tombstones -= 1
+        keys[i] = key
+        self.hashes[i] = h
+        self.vals[i] = val
+        self.live += 1
+
+    def delete_at(self, i):
+        self.keys[i] = _TOMBSTONE
+        self.vals[i] = None
+        self.live -= 1
+        self.tombstones += 1
+
+    def slots(self):
+        keys, vals = self.keys, self.vals
+        for i in range(len(keys)):
+            k = keys[i]
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                yield i, k, vals[i]
+
+
+class HashTable:
+    """
+    Open-addressing hash map with linear probing.
+
+    - keys, values and cached hashes live in parallel arrays
+    - deletes leave tombstones; once live + tombstone slots pass
+      load_factor the table is rebuilt, doubling only if live entries
+      alone need the room, so tombstones are compacted away
+    - rebuilds are incremental: the old table is drained a few slots per
+      operation instead of all at once, so no single call pays for a
+      full rehash
+    """
+
+    _MIGRATE_STEP = 16
+
+    def __init__(self, capacity=8, load_factor=0.7):
+        if not 0.0 < load_factor < 1.0:
+            raise ValueError("load_factor must be between 0 and 1.")
+        self.load_factor = load_factor
+
+        cap = 8
+        while cap * load_factor < capacity:
+            cap *= 2
+        self._table = _Table(cap)
+        self._old = None
+        self._migrate_pos = 0
+
+    def _migrate(self, steps):
+        old = self._old
+        table = self._table
+        keys = old.keys
+        end = min(self._migrate_pos + steps, len(keys))
+
+        for i in range(self._migrate_pos, end):
+            k = keys[i]
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                table.insert_new(k, old.hashes[i], old.vals[i])
+                # leave a tombstone so the old copy cannot be found again
+                old.delete_at(i)
+
+        self._migrate_pos = end
+        if end == len(keys):
+            self._old = None
+
+    def _reserve_one(self):
+        table = self._table
+        cap = len(table.keys)
+        if table.live + table.tombstones + 1 <= cap * self.load_factor:
+            return
+
+        if self._old is not None:
+            self._migrate(len(self._old.keys))
+
+        live = table.live + 1
+        new_cap = cap * 2 if live > cap * self.load_factor / 2 else cap
+        self._old = table
+        self._table = _Table(new_cap)
+        self._migrate_pos = 0
+
+    def put(self, key, value):          # O(1) expected
+        h = hash(key)
+        if self._old is not None:
+            self._migrate(self._MIGRATE_STEP)
+
+        table = self._table
+        i = table.find(key, h)
+        if i >= 0:
+            table.vals[i] = value
+            return
+
+        if self._old is not None:
+            j = self._old.find(key, h)
+            if j >= 0:
+                self._old.vals[j] = value
+                return
+
+        self._reserve_one()
+        self._table.insert_new(key, h, value)
+
+    def get(self, key, default=None):   # O(1) expected
+        h = hash(key)
+        table = self._table
+        i = table.find(key, h)
+        if i >= 0:
+            return table.vals[i]
+
+        if self._old is not None:
+            j = self._old.find(key, h)
+            if j >= 0:
+                return self._old.vals[j]
+
+        return default
+
+    def remove(self, key):              # O(1) expected
+        """Remove key and return its value."""
+        h = hash(key)
+        if self._old is not None:
+            self._migrate(self._MIGRATE_STEP)
+
+        for table in (self._table, self._old):
+            if table is None:
+                continue
+            i = table.find(key, h)
+            if i >= 0:
+                value = table.vals[i]
+                table.delete_at(i)
+                return value
+
+        raise KeyError(key)
+
+    def compact(self):                  # O(n)
+        """Rebuild now into the smallest table that fits, dropping tombstones."""
+        if self._old is not None:
+            self._migrate(len(self._old.keys))
+
+        live = self._table.live
+        cap = 8
+        while cap * self.load_factor < live:
+            cap *= 2
+
+        old = self._table
+        self._table = _Table(cap)
+        for i, k, v in old.slots():
+            self._table.insert_new(k, old.hashes[i], v)
+
+    def clear(self):                    # O(1)
+        self._table = _Table(8)
+        self._old = None
+        self._migrate_pos = 0
+
+    def stats(self):                    # O(capacity)
+        """
+        Occupancy and probe-length figures for the active table. A probe
+        length is how many slots past its home slot an entry sits, so a
+        long histogram tail points at clustered or colliding keys.
+        """
+        table = self._table
+        cap = len(table.keys)
+
+        hist = {}
+        total = 0
+        for i, _, _ in table.slots():
+            d = (i - (table.hashes[i] & table.mask)) & table.mask
+            hist[d] = hist.get(d, 0) + 1
+            total += d
+
+        return {
+            "capacity": cap,
+            "size": len(self),
+            "tombstones": table.tombstones,
+            "load": table.live / cap,
+            "occupancy": (table.live + table.tombstones) / cap,
+            "probe_histogram": dict(sorted(hist.items())),
+            "max_probe": max(hist, default=0),
+            "mean_probe": total / table.live if table.live else 0.0,
+            "resizing": self._old is not None,
+            "pending_migration": self._old.live if self._old is not None else 0,
+        }
+
+    def items(self):
+        for table in (self._table, self._old):
+            if table is not None:
+                for _, k, v in table.slots():
+                    yield k, v
+
+    def keys(self):
+        for k, _ in self.items():
+            yield k
+
+    def values(self):
+        for _, v in self.items():
+            yield v
+
+    def __getitem__(self, key):
+        value = self.get(key, _EMPTY)
+        if value is _EMPTY:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.remove(key)
+
+    def __contains__(self, key):
+        return self.get(key, _EMPTY) is not _EMPTY
+
+    def __len__(self):
+        n = self._table.live
+        if self._old is not None:
+            n += self._old.live
+        return n
+
+    def __iter__(self):
+        return self.keys()
+
+    def __repr__(self):
+        return f"HashTable({dict(self.items())})"
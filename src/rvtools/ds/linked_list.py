@@ -1,4 +1,6 @@
 class LLNode:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next: LLNode = None
@@ -6,24 +8,28 @@ class LLNode:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.size = 0
 
-    def append(self, data):             # O(n)
+    def append(self, data):             # O(1)
         new_node = LLNode(data)
+        self.size += 1
 
         if self.head is None:
             self.head = new_node
+            self.tail = new_node
             return
 
-        current = self.head
-        while current.next is not None:
-            current = current.next
-        
-        current.next = new_node
+        self.tail.next = new_node
+        self.tail = new_node
     
     def prepend(self, data):            # O(1)
         new_node = LLNode(data)
         new_node.next = self.head
         self.head = new_node
+        self.size += 1
+        if self.tail is None:
+            self.tail = new_node
     
     def insert(self, idx, data):        # O(n)
         new_node = LLNode(data)
@@ -44,6 +50,9 @@ class LinkedList:
         
         new_node.next = current.next
         current.next = new_node
+        self.size += 1
+        if new_node.next is None:
+            self.tail = new_node
 
     def delete_val(self, val):          # O(n)
         if self.head is None:
@@ -51,6 +60,9 @@ class LinkedList:
 
         if self.head.data == val:
             self.head = self.head.next
+            self.size -= 1
+            if self.head is None:
+                self.tail = None
             return
 
         current = self.head
@@ -63,23 +75,35 @@ class LinkedList:
         
         node_del = current.next
         current.next = node_del.next
+        self.size -= 1
+        if node_del is self.tail:
+            self.tail = current
     
-    def delete_idx(self, idx):
+    def delete_idx(self, idx):          # O(n)
+        if self.head is None:
+            raise IndexError("Index out of Range")
+
         if idx == 0:
             self.head = self.head.next
+            self.size -= 1
+            if self.head is None:
+                self.tail = None
             return
 
         current = self.head
         current_idx = 0
 
-        if current is not None and current_idx < idx - 1:
+        while current is not None and current_idx < idx - 1:
             current = current.next
             current_idx += 1
         
         if current is None or current.next is None:
             raise IndexError("Index out of Range")
         
+        if current.next is self.tail:
+            self.tail = current
         current.next = current.next.next
+        self.size -= 1
     
     def contains_val(self, val):        # O(n)
         current = self.head
@@ -94,6 +118,7 @@ class LinkedList:
     def reverse(self):                  # O(n)
         prev = None
         current = self.head
+        self.tail = current
 
         while current is not None:
             next_node = current.next
@@ -103,13 +128,8 @@ class LinkedList:
 
         self.head = prev
     
-    def length(self):                   # O(n)
-        count = 0
-        current = self.head
-        while current is not None:
-            count += 1
-            current = current.next
-        return count
+    def length(self):                   # O(1)
+        return self.size
     
     def get(self, idx):                 # O(n)
         current = self.head
@@ -171,27 +191,124 @@ class LinkedList:
         for v in values:
             self.append(v)
 
-    def remove_duplicates(self):        # O(n^2)
+    def remove_duplicates(self, keep="first"): # O(n)
+        """
+        Drop repeated values, keeping the "first" or "last" occurrence.
+        Hashable data uses a seen-set; unhashable data falls back to a
+        linear scan over the unhashable values seen so far.
+        """
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be 'first' or 'last'.")
+
+        if keep == "last":
+            self.reverse()
+            self.remove_duplicates("first")
+            self.reverse()
+            return
+
+        seen = set()
+        seen_unhashable = []
+        prev = None
         current = self.head
-        while current:
-            runner = current
-            while runner.next:
-                if runner.next.data == current.data:
-                    runner.next = runner.next.next
-                else:
-                    runner = runner.next
+
+        while current is not None:
+            data = current.data
+            try:
+                dup = data in seen
+                if not dup:
+                    seen.add(data)
+            except TypeError:
+                dup = data in seen_unhashable
+                if not dup:
+                    seen_unhashable.append(data)
+
+            if dup:
+                prev.next = current.next
+                self.size -= 1
+            else:
+                prev = current
             current = current.next
-        
-    def get_tail(self):                 # O(n)
+
+        self.tail = prev
+
+    def extend(self, values):           # O(1) for a LinkedList, else O(k)
+        """
+        Append values. Another LinkedList is spliced on by relinking its
+        nodes, which leaves it empty.
+        """
+        if isinstance(values, LinkedList) and values is not self:
+            if values.head is None:
+                return
+            if self.head is None:
+                self.head = values.head
+            else:
+                self.tail.next = values.head
+            self.tail = values.tail
+            self.size += values.size
+            values.clear()
+            return
+
+        for v in list(values) if values is self else values:
+            self.append(v)
+
+    def filter_in_place(self, pred):    # O(n)
+        """Unlink every node whose data fails pred."""
+        prev = None
         current = self.head
-        if not current:
-            return None
-        while current.next:
+
+        while current is not None:
+            if pred(current.data):
+                prev = current
+            else:
+                if prev is None:
+                    self.head = current.next
+                else:
+                    prev.next = current.next
+                self.size -= 1
             current = current.next
-        return current
+
+        self.tail = prev
+
+    def merge_sorted(self, other):      # O(n + m)
+        """
+        Merge another sorted LinkedList into this sorted one by relinking
+        nodes; ties keep this list's nodes first. Leaves other empty.
+        """
+        if other is self:
+            raise ValueError("Cannot merge a list with itself.")
+
+        dummy = LLNode(None)
+        tail = dummy
+        a, b = self.head, other.head
+
+        while a is not None and b is not None:
+            if b.data < a.data:
+                tail.next = b
+                b = b.next
+            else:
+                tail.next = a
+                a = a.next
+            tail = tail.next
+
+        if a is not None:
+            tail.next = a               # self.tail is still the last node
+        elif b is not None:
+            tail.next = b
+            self.tail = other.tail
+        else:
+            self.tail = tail if tail is not dummy else None
+
+        self.head = dummy.next
+        self.size += other.size
+        other.clear()
+
+    def get_tail(self):                 # O(1)
+        return self.tail
     
     def clear(self):                    # O(1)
         self.head = None
+        self.tail = None
+        self.size = 0
 
     def __contains__(self, val):
         return self.contains_val(val)
@@ -0,0 +1,135 @@
+class PriorityQueue:
+    """
+    Indexed d-ary min-heap. Items must be hashable and unique; a position
+    index lets update, decrease_key and remove find an item in O(1), so
+    no stale entries are ever left behind.
+
+    - _items / _prios: parallel heap arrays
+    - _pos: item -> index in the heap arrays
+    """
+
+    def __init__(self, items=(), arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2.")
+        self._d = arity
+        self._items = []
+        self._prios = []
+        self._pos = {}
+
+        for item, priority in items:
+            if item in self._pos:
+                raise KeyError(f"Item {item} already exists.")
+            self._pos[item] = len(self._items)
+            self._items.append(item)
+            self._prios.append(priority)
+
+        # bottom-up heapify, O(n)
+        for i in range((len(self._items) - 2) // self._d, -1, -1):
+            self._sift_down(i)
+
+    def _swap(self, i, j):
+        items, prios = self._items, self._prios
+        items[i], items[j] = items[j], items[i]
+        prios[i], prios[j] = prios[j], prios[i]
+        self._pos[items[i]] = i
+        self._pos[items[j]] = j
+
+    def _sift_up(self, i):
+        d = self._d
+        prios = self._prios
+        while i > 0:
+            parent = (i - 1) // d
+            if prios[i] < prios[parent]:
+                self._swap(i, parent)
+                i = parent
+            else:
+                break
+
+    def _sift_down(self, i):
+        d = self._d
+        prios = self._prios
+        n = len(prios)
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if prios[c] < prios[best]:
+                    best = c
+            if prios[best] < prios[i]:
+                self._swap(i, best)
+                i = best
+            else:
+                break
+
+    def push(self, item, priority):     # O(log n)
+        if item in self._pos:
+            raise KeyError(f"Item {item} already exists.")
+        self._pos[item] = len(self._items)
+        self._items.append(item)
+        self._prios.append(priority)
+        self._sift_up(len(self._items) - 1)
+
+    def pop(self):                      # O(log n)
+        """Remove and return the (item, priority) with the lowest priority."""
+        if not self._items:
+            raise IndexError("PriorityQueue is Empty.")
+        item, priority = self._items[0], self._prios[0]
+        self._remove_at(0)
+        return item, priority
+
+    def peek(self):                     # O(1)
+        if not self._items:
+            raise IndexError("PriorityQueue is Empty.")
+        return self._items[0], self._prios[0]
+
+    def _remove_at(self, i):
+        last = len(self._items) - 1
+        if i != last:
+            self._swap(i, last)
+        del self._pos[self._items.pop()]
+        self._prios.pop()
+        if i < last:
+            self._sift_down(i)
+            self._sift_up(i)
+
+    def update(self, item, priority):   # O(log n)
+        """Change item's priority in either direction."""
+        i = self._pos[item]
+        old = self._prios[i]
+        self._prios[i] = priority
+        if priority < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def decrease_key(self, item, priority): # O(log n)
+        i = self._pos[item]
+        if self._prios[i] < priority:
+            raise ValueError("decrease_key cannot increase a priority.")
+        self._prios[i] = priority
+        self._sift_up(i)
+
+    def remove(self, item):             # O(log n)
+        """Remove item and return its priority."""
+        i = self._pos[item]
+        priority = self._prios[i]
+        self._remove_at(i)
+        return priority
+
+    def priority(self, item):           # O(1)
+        return self._prios[self._pos[item]]
+
+    def is_empty(self):
+        return len(self._items) == 0
+
+    def __contains__(self, item):
+        return item in self._pos
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        pairs = ", ".join(f"({item!r}, {prio!r})" for item, prio in zip(self._items, self._prios))
+        return f"PriorityQueue([{pairs}])"
@@ -1,38 +1,139 @@
 class Queue:
-    def __init__(self):
-        self._in = []
-        self.out = []
+    """
+    FIFO queue over a circular buffer.
 
-    def enqueue(self, val):             # O(1)
-        self._in.append(val)
+    - capacity=None: unbounded; the buffer doubles when it fills up
+    - capacity=N: fixed size; a full queue either raises IndexError
+      (overflow="raise") or drops its oldest items (overflow="overwrite")
+    """
+
+    _MIN_CAPACITY = 8
+
+    def __init__(self, capacity=None, overflow="raise"):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer.")
+        if overflow not in ("raise", "overwrite"):
+            raise ValueError("overflow must be 'raise' or 'overwrite'.")
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self._buf = [None] * (capacity or self._MIN_CAPACITY)
+        self._head = 0
+        self._size = 0
+
+    def _grow(self, needed):
+        cap = len(self._buf)
+        while cap < needed:
+            cap *= 2
+        items = self.to_list()
+        self._buf = items + [None] * (cap - len(items))
+        self._head = 0
+
+    def _write(self, values):
+        # copy values in after the current tail, wrapping at most once
+        cap = len(self._buf)
+        k = len(values)
+        tail = (self._head + self._size) % cap
+        first = min(k, cap - tail)
+        self._buf[tail:tail + first] = values[:first]
+        if first < k:
+            self._buf[:k - first] = values[first:]
+        self._size += k
+
+    def _drop(self, n):
+        # discard the n oldest items
+        cap = len(self._buf)
+        head = self._head
+        first = min(n, cap - head)
+        self._buf[head:head + first] = [None] * first
+        if first < n:
+            self._buf[:n - first] = [None] * (n - first)
+        self._head = (head + n) % cap
+        self._size -= n
+
+    def enqueue(self, val):             # O(1) amortized
+        cap = len(self._buf)
+        if self._size == cap:
+            if self.capacity is None:
+                self._grow(cap + 1)
+                cap = len(self._buf)
+            elif self.overflow == "overwrite":
+                self._buf[self._head] = val
+                self._head = (self._head + 1) % cap
+                return
+            else:
+                raise IndexError("Queue is Full.")
+
+        self._buf[(self._head + self._size) % cap] = val
+        self._size += 1
+
+    def enqueue_many(self, values):     # O(k)
+        values = list(values)
+        k = len(values)
+        if k == 0:
+            return
+
+        if self.capacity is None:
+            if self._size + k > len(self._buf):
+                self._grow(self._size + k)
+        elif self._size + k > self.capacity:
+            if self.overflow == "raise":
+                raise IndexError("Queue is Full.")
+            if k >= self.capacity:
+                # only the newest `capacity` values survive
+                self._buf[:] = values[-self.capacity:]
+                self._head = 0
+                self._size = self.capacity
+                return
+            self._drop(self._size + k - self.capacity)
+
+        self._write(values)
 
     def dequeue(self):                  # O(1)
         if self.is_empty():
             raise IndexError("Queue is Empty.")
-        
-        if not self.out:
-            while self._in:
-                self.out.append(self._in.pop())
-        
-        return self.out.pop()
+
+        val = self._buf[self._head]
+        self._buf[self._head] = None
+        self._head = (self._head + 1) % len(self._buf)
+        self._size -= 1
+        return val
+
+    def dequeue_many(self, n):          # O(n)
+        """Dequeue up to n items, oldest first."""
+        if n < 0:
+            raise ValueError("n must be non-negative.")
+        n = min(n, self._size)
+
+        cap = len(self._buf)
+        head = self._head
+        first = min(n, cap - head)
+        items = self._buf[head:head + first]
+        if first < n:
+            items += self._buf[:n - first]
+
+        self._drop(n)
+        return items
 
     def peek(self):                     # O(1)
         if self.is_empty():
             raise IndexError("Queue is Empty.")
-        
-        if not self.out:
-            while self._in:
-                self.out.append(self._in.pop())
-        
-        return self.out[-1]
-    
+        return self._buf[self._head]
+
+    def to_list(self):                  # O(n)
+        end = self._head + self._size
+        if end <= len(self._buf):
+            return self._buf[self._head:end]
+        return self._buf[self._head:] + self._buf[:end - len(self._buf)]
+
     def is_empty(self):
-        return len(self._in) == 0 and len(self.out) == 0
+        return self._size == 0
+
+    def is_full(self):
+        return self.capacity is not None and self._size == self.capacity
 
     def __len__(self):
-        return len(self._in) + len(self.out)
+        return self._size
 
     def __repr__(self):
-        out_copy = list(reversed(self.out))
-        in_copy = self._in.copy()
-        return f"Queue({out_copy + in_copy})"
\ No newline at end of file
+        return f"Queue({self.to_list()})"
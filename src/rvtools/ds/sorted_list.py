@@ -0,0 +1,190 @@
+from array import array
+from bisect import bisect_left, bisect_right, insort_right
+from itertools import chain
+
+
+class SortedList:
+    """
+    Ordered container with the BinaryTree API, stored as a list of sorted
+    blocks (a flat, one-level B+-tree) instead of one node per value.
+
+    - _blocks: sorted sublists of at most 2 * load values, in order
+    - _maxes:  last value of each block, bisected to find the right block
+
+    Pass a typecode (e.g. "q" or "d") to keep each block in a compact
+    array.array of machine values instead of a list of Python objects.
+    """
+
+    def __init__(self, load=512, typecode=None):
+        if load < 2:
+            raise ValueError("load must be at least 2.")
+        self._load = load
+        self._typecode = typecode
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    def _new_block(self, values=()):
+        if self._typecode is None:
+            return list(values)
+        return array(self._typecode, values)
+
+    @classmethod
+    def from_sorted(cls, values, load=512, typecode=None): # O(n)
+        sl = cls(load=load, typecode=typecode)
+        vals = list(values)
+        for i in range(len(vals) - 1):
+            if vals[i + 1] < vals[i]:
+                raise ValueError("from_sorted expects values in sorted order.")
+
+        sl._blocks = [sl._new_block(vals[i:i + load]) for i in range(0, len(vals), load)]
+        sl._maxes = [block[-1] for block in sl._blocks]
+        sl._len = len(vals)
+        return sl
+
+    @classmethod
+    def from_iterable(cls, values, load=512, typecode=None): # O(n log n)
+        return cls.from_sorted(sorted(values), load=load, typecode=typecode)
+
+    def append(self, data):             # O(log n + load)
+        if not self._blocks:
+            self._blocks.append(self._new_block([data]))
+            self._maxes.append(data)
+            self._len = 1
+            return
+
+        i = bisect_right(self._maxes, data)
+        if i == len(self._maxes):
+            i -= 1
+            self._blocks[i].append(data)
+            self._maxes[i] = data
+        else:
+            insort_right(self._blocks[i], data)
+
+        self._len += 1
+        if len(self._blocks[i]) > 2 * self._load:
+            self._split(i)
+
+    def _split(self, i):
+        block = self._blocks[i]
+        half = len(block) // 2
+        right = block[half:]
+        del block[half:]
+        self._blocks.insert(i + 1, right)
+        self._maxes[i] = block[-1]
+        self._maxes.insert(i + 1, right[-1])
+
+    def _locate(self, val):
+        # (block index, position) of the first value == val, or None
+        i = bisect_left(self._maxes, val)
+        if i == len(self._maxes):
+            return None
+        block = self._blocks[i]
+        j = bisect_left(block, val)
+        if block[j] != val:
+            return None
+        return i, j
+
+    def delete(self, val):              # O(log n + load)
+        pos = self._locate(val)
+        if pos is None:
+            return
+
+        i, j = pos
+        block = self._blocks[i]
+        del block[j]
+        self._len -= 1
+
+        if not block:
+            del self._blocks[i]
+            del self._maxes[i]
+            return
+
+        self._maxes[i] = block[-1]
+
+        # fold undersized blocks into their right neighbour
+        if len(block) < self._load // 2 and i + 1 < len(self._blocks):
+            block.extend(self._blocks[i + 1])
+            del self._blocks[i + 1]
+            del self._maxes[i + 1]
+            self._maxes[i] = block[-1]
+            if len(block) > 2 * self._load:
+                self._split(i)
+
+    def contains_val(self, val):        # O(log n)
+        return self._locate(val) is not None
+
+    def min(self):                      # O(1)
+        if not self._blocks:
+            raise ValueError("SortedList is Empty.")
+        return self._blocks[0][0]
+
+    def max(self):                      # O(1)
+        if not self._blocks:
+            raise ValueError("SortedList is Empty.")
+        return self._maxes[-1]
+
+    def iter_inorder(self):             # O(n), lazy
+        return chain.from_iterable(self._blocks)
+
+    def inorder(self):                  # O(n)
+        return list(self.iter_inorder())
+
+    def to_sorted_list(self):
+        return self.inorder()
+
+    def to_list(self):
+        return self.inorder()
+
+    def iter_range(self, lo, hi):       # O(log n + k), lazy
+        """Values v with lo <= v <= hi, in sorted order."""
+        i = bisect_left(self._maxes, lo)
+        if i == len(self._blocks):
+            return
+
+        block = self._blocks[i]
+        j = bisect_left(block, lo)
+        while True:
+            end = bisect_right(block, hi)
+            yield from block[j:end]
+            if end < len(block):
+                return
+            i += 1
+            if i == len(self._blocks):
+                return
+            block = self._blocks[i]
+            j = 0
+
+    def count_range(self, lo, hi):      # O(log n + k / load)
+        """Number of values v with lo <= v <= hi."""
+        i = bisect_left(self._maxes, lo)
+        count = 0
+        j = None
+        while i < len(self._blocks):
+            block = self._blocks[i]
+            if j is None:
+                j = bisect_left(block, lo)
+            end = bisect_right(block, hi)
+            count += max(0, end - j)
+            if end < len(block):
+                break
+            i += 1
+            j = 0
+        return count
+
+    def clear(self):                    # O(1)
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    def __contains__(self, val):
+        return self.contains_val(val)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return self.iter_inorder()
+
+    def __str__(self):
+        return "SortedList(" + ", ".join(str(x) for x in self.iter_inorder()) + ")"
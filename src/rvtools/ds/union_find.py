@@ -0,0 +1,72 @@
+class UnionFind:
+    """
+    Disjoint-set forest with path compression and union by rank.
+    find/union run in amortized O(α(n)), effectively constant.
+    """
+
+    def __init__(self, items=()):
+        self._parent = {}
+        self._rank = {}
+        self._sets = 0
+        for x in items:
+            self.add(x)
+
+    def add(self, x):                   # O(1)
+        if x not in self._parent:
+            self._parent[x] = x
+            self._rank[x] = 0
+            self._sets += 1
+
+    def find(self, x):                  # O(α(n))
+        parent = self._parent
+        if x not in parent:
+            raise ValueError(f"Item '{x}' Not Found.")
+
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        # path compression: point every node on the path at the root
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+
+        return root
+
+    def union(self, a, b):              # O(α(n))
+        ra = self.find(a)
+        rb = self.find(b)
+        if ra == rb:
+            return False
+
+        rank = self._rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self._parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+
+        self._sets -= 1
+        return True
+
+    def connected(self, a, b):          # O(α(n))
+        return self.find(a) == self.find(b)
+
+    @property
+    def num_sets(self):
+        return self._sets
+
+    def groups(self):                   # O(n)
+        """Sets as lists, ordered by each set's first-added member."""
+        groups = {}
+        for x in self._parent:
+            groups.setdefault(self.find(x), []).append(x)
+        return list(groups.values())
+
+    def __contains__(self, x):
+        return x in self._parent
+
+    def __len__(self):
+        return len(self._parent)
+
+    def __repr__(self):
+        return f"UnionFind(items={len(self._parent)}, sets={self._sets})"
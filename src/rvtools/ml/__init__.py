@@ -13,6 +13,18 @@ from .linalg import (
     cosine_similarity,
 )
 
+from .backend import (
+    get_backend,
+    set_backend,
+    use_backend,
+)
+
+from .pairwise import (
+    pairwise_distances,
+    pairwise_distances_chunked,
+    cdist,
+)
+
 from .dataset import (
     Dataset,
     tt_split,
@@ -31,6 +43,12 @@ __all__ = [
     "manhattan_distance",
     "mean_vector",
     "cosine_similarity",
+    "get_backend",
+    "set_backend",
+    "use_backend",
+    "pairwise_distances",
+    "pairwise_distances_chunked",
+    "cdist",
     "Dataset",
     "tt_split"
 ]
\ No newline at end of file
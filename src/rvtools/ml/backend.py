@@ -0,0 +1,240 @@
+"""
+Pluggable compute kernels for rvtools.ml.linalg.
+
+The pure-Python backend is the default and has no dependencies. When
+NumPy is installed, set_backend("numpy") or `with use_backend("numpy"):`
+routes Vector/Matrix math through vectorized NumPy kernels instead.
+Kernels take raw storage (lists, array('d'), memoryviews) or Matrix
+objects and return plain Python floats and lists, or a flat row-major
+array('d') for Matrix results, so callers see the same types from
+either backend. The elementwise vector kernels (add, subtract, scale)
+are the exception: they return any iterable of floats (a float64
+ndarray from NumPy), which Vector converts to its own storage type.
+"""
+
+from array import array
+from contextlib import contextmanager
+from operator import add as _add, mul as _mul, sub as _sub
+
+
+def _make_backend(name):
+    return _BACKENDS[name]()
+
+
+class _Backend:
+    # pickles by name, so a spawned pool worker rebuilds the same backend
+    # without touching its own process-wide default
+    name = None
+
+    def __reduce__(self):
+        return _make_backend, (self.name,)
+
+
+class PythonBackend(_Backend):
+    name = "python"
+    _BLOCK = 64
+
+    def dot(self, x, y):
+        return sum(map(_mul, x, y))
+
+    def l2_norm(self, x):
+        return (sum(map(_mul, x, x))) ** 0.5
+
+    def l1_norm(self, x):
+        return sum(map(abs, x))
+
+    def add(self, x, y):
+        return map(_add, x, y)
+
+    def subtract(self, x, y):
+        return map(_sub, x, y)
+
+    def scale(self, s, x):
+        return (s * a for a in x)
+
+    def euclidean_distance(self, x, y):
+        return (sum(d * d for d in map(_sub, x, y))) ** 0.5
+
+    def manhattan_distance(self, x, y):
+        return sum(map(abs, map(_sub, x, y)))
+
+    def mean(self, vectors):
+        n = len(vectors[0])
+        sums = [0.0] * n
+        count = len(vectors)
+
+        for v in vectors:
+            for i, val in enumerate(v):
+                sums[i] += val
+
+        return [s / count for s in sums]
+
+    def matvec(self, m, v):
+        return [sum(map(_mul, m.row(i), v)) for i in range(m.nrows)]
+
+    def matmat(self, a, b):
+        # rows of a and columns of b are pulled out once as lists so every
+        # inner product runs as sum(map(mul, ...)) with no per-element
+        # indexing; output columns are done in tiles of _BLOCK so that
+        # tile's columns stay hot while all rows of a stream past them
+        n, p = a.nrows, b.ncols
+        a_rows = [a.row(i).tolist() for i in range(n)]
+        b_cols = [b.col(j).tolist() for j in range(p)]
+        out = array("d", bytes(8 * n * p))
+
+        for j0 in range(0, p, self._BLOCK):
+            tile = b_cols[j0:j0 + self._BLOCK]
+            for i, row in enumerate(a_rows):
+                start = i * p + j0
+                out[start:start + len(tile)] = array("d", [sum(map(_mul, row, col)) for col in tile])
+        return out
+
+    def matadd(self, a, b):
+        return array("d", map(_add, a._flat(), b._flat()))
+
+    def matsub(self, a, b):
+        return array("d", map(_sub, a._flat(), b._flat()))
+
+    def as_rows(self, rows):
+        return rows
+
+    def sq_norms(self, rows):
+        return [sum(map(_mul, r, r)) for r in rows]
+
+    def pairwise(self, xs, ys, metric, x_sq, y_sq):
+        out = array("d")
+        if metric == "manhattan":
+            for x in xs:
+                out.extend([sum(map(abs, map(_sub, x, y))) for y in ys])
+            return out
+
+        for x, xx in zip(xs, x_sq):
+            dots = [sum(map(_mul, x, y)) for y in ys]
+            if metric == "cosine":
+                out.extend([1.0 - d / (xx * yy) ** 0.5 for d, yy in zip(dots, y_sq)])
+                continue
+            sq = [max(xx + yy - 2.0 * d, 0.0) for d, yy in zip(dots, y_sq)]
+            out.extend(sq if metric == "sqeuclidean" else [v ** 0.5 for v in sq])
+        return out
+
+
+class NumpyBackend(_Backend):
+    name = "numpy"
+
+    def __init__(self):
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("The numpy backend requires NumPy to be installed.") from None
+        self.np = numpy
+
+    def _vec(self, x):
+        # zero-copy over array('d') and (strided) memoryviews
+        return self.np.asarray(x, dtype=self.np.float64)
+
+    def _mat(self, m):
+        # strided view over the Matrix's flat storage, transposes included
+        itemsize = m._data.itemsize
+        return self.np.ndarray(
+            m.shape,
+            dtype=self.np.float64,
+            buffer=m._data,
+            offset=m._offset * itemsize,
+            strides=(m._rs * itemsize, m._cs * itemsize),
+        )
+
+    def _flat(self, result):
+        return array("d", self.np.ascontiguousarray(result, dtype=self.np.float64).tobytes())
+
+    def dot(self, x, y):
+        return float(self.np.dot(self._vec(x), self._vec(y)))
+
+    def l2_norm(self, x):
+        return float(self.np.linalg.norm(self._vec(x)))
+
+    def l1_norm(self, x):
+        return float(self.np.abs(self._vec(x)).sum())
+
+    def add(self, x, y):
+        return self._vec(x) + self._vec(y)
+
+    def subtract(self, x, y):
+        return self._vec(x) - self._vec(y)
+
+    def scale(self, s, x):
+        return s * self._vec(x)
+
+    def euclidean_distance(self, x, y):
+        return float(self.np.linalg.norm(self._vec(x) - self._vec(y)))
+
+    def manhattan_distance(self, x, y):
+        return float(self.np.abs(self._vec(x) - self._vec(y)).sum())
+
+    def mean(self, vectors):
+        return self.np.asarray(vectors, dtype=self.np.float64).mean(axis=0).tolist()
+
+    def matvec(self, m, v):
+        return (self._mat(m) @ self._vec(v)).tolist()
+
+    def matmat(self, a, b):
+        return self._flat(self._mat(a) @ self._mat(b))
+
+    def matadd(self, a, b):
+        return self._flat(self._mat(a) + self._mat(b))
+
+    def matsub(self, a, b):
+        return self._flat(self._mat(a) - self._mat(b))
+
+    def as_rows(self, rows):
+        return self.np.asarray(rows, dtype=self.np.float64)
+
+    def sq_norms(self, rows):
+        return self.np.einsum("ij,ij->i", rows, rows)
+
+    def pairwise(self, xs, ys, metric, x_sq, y_sq):
+        np = self.np
+        if metric == "manhattan":
+            # one row of xs at a time keeps the temporary at len(ys) x dim
+            d = np.empty((len(xs), len(ys)))
+            for i, x in enumerate(xs):
+                d[i] = np.abs(ys - x).sum(axis=1)
+        elif metric == "cosine":
+            d = 1.0 - (xs @ ys.T) / np.sqrt(np.outer(x_sq, y_sq))
+        else:
+            d = np.maximum(x_sq[:, None] + y_sq[None, :] - 2.0 * (xs @ ys.T), 0.0)
+            if metric == "euclidean":
+                d = np.sqrt(d)
+        return self._flat(d)
+
+
+_BACKENDS = {
+    "python": PythonBackend,
+    "numpy": NumpyBackend,
+}
+
+_active = PythonBackend()
+
+
+def get_backend():
+    return _active
+
+
+def set_backend(name):
+    """Switch the active backend ("python" or "numpy") and return it."""
+    global _active
+    if name not in _BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Choose from {sorted(_BACKENDS)}.")
+    if _active.name != name:
+        _active = _make_backend(name)
+    return _active
+
+
+@contextmanager
+def use_backend(name):
+    """Temporarily switch backends, e.g. to A/B results against each other."""
+    previous = _active.name
+    backend = set_backend(name)
+    try:
+        yield backend
+    finally:
+        set_backend(previous)
@@ -1,6 +1,87 @@
+import sys
+from array import array
+
+from .backend import get_backend as _get_backend
+
+
 class Vector:
-    def __init__(self, data):
-        self._data = list(data)
+    """
+    1D vector over a list (default), a contiguous array('d') (typed=True),
+    or any external float64 buffer wrapped zero-copy by from_buffer().
+    Typed vectors expose their memory through buffer() and
+    __array_interface__, so NumPy can wrap them without copying.
+    memoryview(v) works directly only on Python 3.12+ (PEP 688); on
+    older versions call v.buffer() instead.
+
+    v += w rebinds v to a new Vector, like v = v + w; iadd(), isub() and
+    imul() update v's own storage (and any buffer it wraps) in place.
+    """
+
+    def __init__(self, data, typed=False):
+        self._data = array("d", data) if typed else list(data)
+
+    @classmethod
+    def from_buffer(cls, buf):
+        """
+        Wrap a float64 buffer (array('d'), NumPy float64 array, ...) without
+        copying. Raw bytes (bytearray, bytes) are reinterpreted as float64;
+        any other item format, or a buffer that is not 1-D, raises
+        ValueError. A list-backed Vector has no buffer of its own, so
+        wrapping one copies it.
+        """
+        mv = buf.buffer() if isinstance(buf, Vector) else memoryview(buf)
+        if mv.ndim != 1:
+            raise ValueError(f"from_buffer expects a 1-D buffer, got {mv.ndim} dimensions.")
+        if mv.format in ("B", "b", "c"):
+            mv = mv.cast("B").cast("d")
+        elif mv.format != "d":
+            raise ValueError(f"from_buffer expects float64 or raw byte data, got format '{mv.format}'.")
+        return cls._wrap(mv)
+
+    @classmethod
+    def _wrap(cls, data):
+        v = cls.__new__(cls)
+        v._data = data
+        return v
+
+    @property
+    def typed(self):
+        return not isinstance(self._data, list)
+
+    def _like(self, values):
+        # new storage of the same kind as self; wrapped buffers yield arrays.
+        # NumPy kernels return float64 ndarrays, which convert in one pass
+        if hasattr(values, "dtype"):
+            if isinstance(self._data, list):
+                return values.tolist()
+            data = array("d")
+            data.frombytes(memoryview(values).cast("B"))
+            return data
+        if isinstance(self._data, list):
+            return list(values)
+        return array("d", values)
+
+    def buffer(self):
+        """memoryview over the vector's storage (a copy for list-backed vectors)."""
+        if isinstance(self._data, list):
+            return memoryview(array("d", self._data))
+        return memoryview(self._data)
+
+    def __buffer__(self, flags):
+        # PEP 688, used by memoryview(v) on Python 3.12+
+        return self.buffer()
+
+    @property
+    def __array_interface__(self):
+        if not isinstance(self._data, array):
+            raise AttributeError("__array_interface__ is only available for array-backed vectors.")
+        address, length = self._data.buffer_info()
+        return {
+            "shape": (length,),
+            "typestr": ("<" if sys.byteorder == "little" else ">") + "f8",
+            "data": (address, False),
+            "version": 3,
+        }
 
     def __len__(self):
         return len(self._data)
@@ -15,13 +96,15 @@ class Vector:
         self._data[idx] = value
 
     def to_list(self):
-        return list(self._data)
+        if isinstance(self._data, list):
+            return list(self._data)
+        return self._data.tolist()
 
     def copy(self):
-        return Vector(self._data)
+        return Vector._wrap(self._like(self._data))
 
     def __repr__(self):
-        return f"Vector({self._data})"
+        return f"Vector({self.to_list()})"
     
     def _check_same_length(self, other):
         if len(self) != len(other):
@@ -29,59 +112,79 @@ class Vector:
 
     def __add__(self, other):
         self._check_same_length(other)
-        return Vector(a + b for a, b in zip(self, other))
+        return Vector._wrap(self._like(_get_backend().add(self._data, _storage(other))))
 
     def __sub__(self, other):
         self._check_same_length(other)
-        return Vector(a - b for a, b in zip(self, other))
+        return Vector._wrap(self._like(_get_backend().subtract(self._data, _storage(other))))
 
     def __rmul__(self, scalar):
-        return Vector(scalar * a for a in self)
+        return Vector._wrap(self._like(_get_backend().scale(scalar, self._data)))
 
     def __mul__(self, scalar):
-        return Vector(scalar * a for a in self)
+        return Vector._wrap(self._like(_get_backend().scale(scalar, self._data)))
+
+    def iadd(self, other):
+        """In-place self += other; writes through to wrapped buffers."""
+        self._check_same_length(other)
+        self._data[:] = self._like(_get_backend().add(self._data, _storage(other)))
+        return self
+
+    def isub(self, other):
+        """In-place self -= other."""
+        self._check_same_length(other)
+        self._data[:] = self._like(_get_backend().subtract(self._data, _storage(other)))
+        return self
+
+    def imul(self, scalar):
+        """In-place self *= scalar."""
+        self._data[:] = self._like(_get_backend().scale(scalar, self._data))
+        return self
+
     
     def dot(self, other):
         """Dot product self · other."""
         self._check_same_length(other)
-        return sum(a * b for a, b in zip(self, other))
+        return _get_backend().dot(self._data, _storage(other))
 
     def l2_norm(self):
         """Euclidean norm."""
-        return (sum(a * a for a in self)) ** 0.5
+        return _get_backend().l2_norm(self._data)
 
     def l1_norm(self):
         """Manhattan norm."""
-        return sum(abs(a) for a in self)
+        return _get_backend().l1_norm(self._data)
 
     def euclidean_distance(self, other):
         self._check_same_length(other)
-        return ((self - other).l2_norm())
+        return _get_backend().euclidean_distance(self._data, _storage(other))
 
     def manhattan_distance(self, other):
         self._check_same_length(other)
-        return ((self - other).l1_norm())
+        return _get_backend().manhattan_distance(self._data, _storage(other))
 
     def cosine_similarity(self, other):
         self._check_same_length(other)
-        denom = self.l2_norm() * Vector(other).l2_norm()
+        denom = self.l2_norm() * _get_backend().l2_norm(_storage(other))
         if denom == 0:
             raise ValueError("Cannot compute cosine similarity with zero vector.")
-        return self.dot(other)
+        return self.dot(other) / denom
 
 class Matrix:
     """
-    Simple 2D matrix wrapper over a list of lists (row-major).
+    2D matrix over one flat array('d') with row/column strides.
 
-    - rows: list of row vectors (python lists)
     - len(M) -> number of rows
-    - M[i][j] indexing
+    - M[i] -> row i as a memoryview (writes go through), M[i, j] -> element
     - M.shape -> (rows, cols)
     - Matrix * Vector -> Vector (matrix-vector product)
     - Matrix @ Matrix -> Matrix (matrix-matrix product)
-    - M.T() -> transpose
+    - M.T(), M.row(i), M.col(j) -> views sharing M's storage; use copy()
+      for an independent contiguous matrix
     """
 
+    __slots__ = ("_data", "_nrows", "_ncols", "_offset", "_rs", "_cs")
+
     def __init__(self, rows):
         if not rows:
             raise ValueError("Matrix requires at least one row.")
@@ -89,71 +192,121 @@ class Matrix:
         row_lengths = {len(r) for r in rows}
         if len(row_lengths) != 1:
             raise ValueError("All rows must have the same length.")
-        self._rows = [list(r) for r in rows]  # deep copy
+
+        data = array("d")
+        for r in rows:
+            data.extend(r)
+        self._set(data, len(rows), row_lengths.pop(), 0, None, 1)
+
+    def _set(self, data, nrows, ncols, offset, rs, cs):
+        self._data = data
+        self._nrows = nrows
+        self._ncols = ncols
+        self._offset = offset
+        self._rs = ncols if rs is None else rs
+        self._cs = cs
+
+    @classmethod
+    def _from_flat(cls, data, nrows, ncols, offset=0, rs=None, cs=1):
+        m = cls.__new__(cls)
+        m._set(data, nrows, ncols, offset, rs, cs)
+        return m
+
+    def _contiguous(self):
+        return self._cs == 1 and self._rs == self._ncols
+
+    def _flat(self):
+        # row-major elements: a zero-copy memoryview when contiguous
+        n = self._nrows * self._ncols
+        if self._contiguous():
+            return memoryview(self._data)[self._offset:self._offset + n]
+        data = array("d")
+        for i in range(self._nrows):
+            data.extend(self.row(i))
+        return memoryview(data)
 
     # --- basic protocol ---
 
     def __len__(self):
         # number of rows
-        return len(self._rows)
+        return self._nrows
 
     @property
     def nrows(self):
-        return len(self._rows)
+        return self._nrows
 
     @property
     def ncols(self):
-        return len(self._rows[0])
+        return self._ncols
 
     @property
     def shape(self):
-        return (self.nrows, self.ncols)
+        return (self._nrows, self._ncols)
+
+    def _index(self, i, n, what):
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"Matrix {what} index out of range.")
+        return i
+
+    def row(self, i):                   # O(1)
+        """View of row i as a memoryview."""
+        i = self._index(i, self._nrows, "row")
+        start = self._offset + i * self._rs
+        return memoryview(self._data)[start:start + self._ncols * self._cs:self._cs]
+
+    def col(self, j):                   # O(1)
+        """View of column j as a memoryview."""
+        j = self._index(j, self._ncols, "column")
+        start = self._offset + j * self._cs
+        return memoryview(self._data)[start:start + self._nrows * self._rs:self._rs]
 
     def __getitem__(self, idx):
-        # row indexing: M[i] is the i-th row (as list)
-        return self._rows[idx]
+        # M[i] -> row view, M[a:b] -> list of row views, M[i, j] -> element
+        if isinstance(idx, tuple):
+            i, j = idx
+            i = self._index(i, self._nrows, "row")
+            j = self._index(j, self._ncols, "column")
+            return self._data[self._offset + i * self._rs + j * self._cs]
+        if isinstance(idx, slice):
+            return [self.row(i) for i in range(*idx.indices(self._nrows))]
+        return self.row(idx)
 
     def __setitem__(self, idx, value):
+        if isinstance(idx, tuple):
+            i, j = idx
+            i = self._index(i, self._nrows, "row")
+            j = self._index(j, self._ncols, "column")
+            self._data[self._offset + i * self._rs + j * self._cs] = value
+            return
         if len(value) != self.ncols:
             raise ValueError("Assigned row must have the correct number of columns.")
-        self._rows[idx] = list(value)
+        self.row(idx)[:] = array("d", value)
 
     def to_lists(self):
-        return [list(r) for r in self._rows]
+        return [self.row(i).tolist() for i in range(self._nrows)]
 
     def copy(self):
-        return Matrix(self._rows)
+        return Matrix._from_flat(array("d", self._flat()), self._nrows, self._ncols)
 
     def __repr__(self):
-        return f"Matrix(rows={self._rows})"
+        return f"Matrix(rows={self.to_lists()})"
 
     # --- basic operations ---
 
-    def T(self):
-        """Transpose: returns a new Matrix."""
-        transposed = []
-        for j in range(self.ncols):
-            col = [self._rows[i][j] for i in range(self.nrows)]
-            transposed.append(col)
-        return Matrix(transposed)
+    def T(self):                        # O(1)
+        """Transpose as a view: swaps the strides, copies nothing."""
+        return Matrix._from_flat(self._data, self._ncols, self._nrows, self._offset, self._cs, self._rs)
 
     def matvec(self, vec):
         """Matrix-vector product: M @ v -> Vector."""
-        if isinstance(vec, Vector):
-            v_list = vec.to_list()
-        else:
-            v_list = list(vec)
+        v = vec._data if isinstance(vec, Vector) else list(vec)
 
-        if len(v_list) != self.ncols:
+        if len(v) != self.ncols:
             raise ValueError("Vector length must match number of matrix columns.")
 
-        result = []
-        for row in self._rows:
-            s = 0
-            for a, b in zip(row, v_list):
-                s += a * b
-            result.append(s)
-        return Vector(result)
+        return Vector(_get_backend().matvec(self, v))
 
     def matmat(self, other):
         """Matrix-matrix product: M @ N -> Matrix."""
@@ -163,17 +316,7 @@ class Matrix:
         if self.ncols != other.nrows:
             raise ValueError("Inner dimensions must agree for matrix multiplication.")
 
-        other_T = other.T()
-        new_rows = []
-        for row in self._rows:
-            new_row = []
-            for col in other_T._rows:
-                s = 0
-                for a, b in zip(row, col):
-                    s += a * b
-                new_row.append(s)
-            new_rows.append(new_row)
-        return Matrix(new_rows)
+        return Matrix._from_flat(_get_backend().matmat(self, other), self.nrows, other.ncols)
 
     def __matmul__(self, other):
         """Use M @ v or M @ N syntax."""
@@ -193,10 +336,7 @@ class Matrix:
         if self.shape != other.shape:
             raise ValueError("Matrices must have the same shape.")
 
-        rows = []
-        for r1, r2 in zip(self._rows, other._rows):
-            rows.append([a + b for a, b in zip(r1, r2)])
-        return Matrix(rows)
+        return Matrix._from_flat(_get_backend().matadd(self, other), self.nrows, self.ncols)
 
     def subtract(self, other):
         """Elementwise matrix subtraction: M - N (same shape)."""
@@ -205,16 +345,22 @@ class Matrix:
         if self.shape != other.shape:
             raise ValueError("Matrices must have the same shape.")
 
-        rows = []
-        for r1, r2 in zip(self._rows, other._rows):
-            rows.append([a - b for a, b in zip(r1, r2)])
-        return Matrix(rows)
+        return Matrix._from_flat(_get_backend().matsub(self, other), self.nrows, self.ncols)
+def _storage(x):
+    # raw data for backend kernels; Vectors hand over their list/array
+    if isinstance(x, Vector):
+        return x._data
+    return x if isinstance(x, (list, tuple, array, memoryview)) else list(x)
 
 def _as_vector(x):
     return x if isinstance(x, Vector) else Vector(x)
 
+def _as_view(x):
+    # read-only wrapper for one-off calls; skips the copy Vector(x) makes
+    return x if isinstance(x, Vector) else Vector._wrap(_storage(x))
+
 def dot(x, y):
-    return _as_vector(x).dot(_as_vector(y))
+    return _as_view(x).dot(_storage(y))
 
 def add(x, y):
     xv = _as_vector(x)
@@ -232,16 +378,16 @@ def scalar_mul(s, x):
     return (s * _as_vector(x)).to_list()
 
 def l2_norm(x):
-    return _as_vector(x).l2_norm()
+    return _as_view(x).l2_norm()
 
 def l1_norm(x):
-    return _as_vector(x).l1_norm()
+    return _as_view(x).l1_norm()
 
 def euclidean_distance(x, y):
-    return _as_vector(x).euclidean_distance(_as_vector(y))
+    return _as_view(x).euclidean_distance(_storage(y))
 
 def manhattan_distance(x, y):
-    return _as_vector(x).manhattan_distance(_as_vector(y))
+    return _as_view(x).manhattan_distance(_storage(y))
 
 def mean_vector(vectors):
     """
@@ -255,14 +401,7 @@ def mean_vector(vectors):
         if len(v) != n:
             raise ValueError("All vectors must have the same length.")
 
-    sums = [0.0] * n
-    count = len(vectors)
-
-    for v in vectors:
-        for i, val in enumerate(v):
-            sums[i] += val
-
-    return [s / count for s in sums]
+    return _get_backend().mean(vectors)
 
 def cosine_similarity(x, y):
-    return _as_vector(x).cosine_similarity(_as_vector(y))
\ No newline at end of file
+    return _as_view(x).cosine_similarity(_storage(y))
\ No newline at end of file
@@ -0,0 +1,119 @@
+from .._parallel import imap_with_state
+from .backend import get_backend
+from .dataset import Dataset
+from .linalg import Matrix, Vector
+
+METRICS = ("euclidean", "sqeuclidean", "manhattan", "cosine")
+
+
+def _block(state, bounds):
+    backend, xs, ys, metric, x_sq, y_sq = state
+    lo, hi = bounds
+    return backend.pairwise(xs[lo:hi], ys, metric, x_sq[lo:hi], y_sq)
+
+
+def _as_rows(X, name):
+    if isinstance(X, Dataset):
+        X = X.features()
+    if isinstance(X, Matrix):
+        rows = X.to_lists()
+    else:
+        rows = [r.to_list() if isinstance(r, Vector) else list(r) for r in X]
+
+    if not rows:
+        raise ValueError(f"{name} must have at least one row.")
+    if len({len(r) for r in rows}) != 1:
+        raise ValueError(f"All rows of {name} must have the same length.")
+    return rows
+
+
+def pairwise_distances_chunked(X, Y=None, metric="euclidean", chunk_size=256, workers=1):
+    """
+    Iterator of (start, block) for consecutive row chunks of X, where
+    block is a Matrix of distances from rows start .. start + len(block) - 1
+    of X to every row of Y (Y=None means X against itself).
+
+    - X, Y: Matrix, Dataset (its features) or a sequence of rows
+    - metric: "euclidean", "sqeuclidean", "manhattan" or "cosine"
+      (cosine distance, 1 - cosine similarity)
+    - chunk_size: rows of X per block, which bounds working memory
+    - workers > 1 (None means one per CPU) computes blocks in a
+      multiprocessing pool; the operands are shipped to each worker once
+      at start-up, so only block bounds and results cross processes
+
+    Inputs are validated, and the active backend is captured, when this is
+    called. Every block then uses that backend, even if set_backend() runs
+    while the iterator is being consumed.
+
+    Squared norms are computed once per row, and euclidean/cosine use
+    ||x||^2 + ||y||^2 - 2 x.y, which turns the inner loop into dot
+    products. This loses a little precision for nearly identical rows;
+    self-distances on the diagonal are set to exactly 0.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Choose from {list(METRICS)}.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive.")
+
+    backend = get_backend()
+    x_rows = _as_rows(X, "X")
+    xs = backend.as_rows(x_rows)
+    x_sq = backend.sq_norms(xs)
+
+    same = Y is None
+    if same:
+        ys, y_sq = xs, x_sq
+        m = len(x_rows)
+    else:
+        y_rows = _as_rows(Y, "Y")
+        if len(y_rows[0]) != len(x_rows[0]):
+            raise ValueError("X and Y must have the same number of columns.")
+        ys = backend.as_rows(y_rows)
+        y_sq = backend.sq_norms(ys)
+        m = len(y_rows)
+
+    if metric == "cosine" and (any(s == 0 for s in x_sq) or any(s == 0 for s in y_sq)):
+        raise ValueError("Cannot compute cosine similarity with zero vector.")
+
+    n = len(x_rows)
+    bounds = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)]
+
+    state = (backend, xs, ys, metric, x_sq, y_sq)
+    blocks = imap_with_state(_block, state, bounds, workers, chunksize=1)
+    return _emit(bounds, blocks, m, same)
+
+
+def _emit(bounds, blocks, m, same):
+    for (lo, hi), flat in zip(bounds, blocks):
+        if same:
+            for i in range(lo, hi):
+                flat[(i - lo) * m + i] = 0.0
+        yield lo, Matrix._from_flat(flat, hi - lo, m)
+
+
+def _collect(blocks):
+    n = m = 0
+    flat = None
+    for _, block in blocks:
+        n += block.nrows
+        m = block.ncols
+        if flat is None:
+            flat = block._data
+        else:
+            flat.extend(block._data)
+    return Matrix._from_flat(flat, n, m)
+
+
+def pairwise_distances(X, Y=None, metric="euclidean", chunk_size=256, workers=1):
+    """
+    Distance Matrix between the rows of X and Y (or X with itself). See
+    pairwise_distances_chunked() for the arguments.
+    """
+    return _collect(pairwise_distances_chunked(X, Y, metric, chunk_size, workers))
+
+
+def cdist(XA, XB, metric="euclidean", chunk_size=256, workers=1):
+    """Distances between every row of XA and every row of XB, as a Matrix."""
+    if XB is None:
+        raise TypeError("cdist expects two inputs; use pairwise_distances(X) for self-distances.")
+    return pairwise_distances(XA, XB, metric, chunk_size, workers)
@@ -0,0 +1,96 @@
+import bisect
+import math
+import random
+
+import pytest
+
+from rvtools.ds import AVLTree, BinaryTree
+
+
+def _check(node, lo=None, hi=None):
+    # returns (height, size) after asserting every cached field and the
+    # ordering / balance invariants below node
+    if node is None:
+        return 0, 0
+    assert lo is None or node.data >= lo
+    assert hi is None or node.data <= hi
+    lh, ls = _check(node.left, lo, node.data)
+    rh, rs = _check(node.right, node.data, hi)
+    height, size = 1 + max(lh, rh), 1 + ls + rs
+    assert node.size == size
+    if hasattr(node, "height"):
+        assert node.height == height
+        assert abs(lh - rh) <= 1
+    return height, size
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_avl_invariants_under_random_appends_and_deletes(seed):
+    rnd = random.Random(seed)
+    t = AVLTree()
+    ref = []
+
+    for _ in range(1500):
+        v = rnd.randrange(200)
+        if rnd.random() < 0.6:
+            t.append(v)
+            bisect.insort(ref, v)
+        else:
+            t.delete(v)
+            i = bisect.bisect_left(ref, v)
+            if i < len(ref) and ref[i] == v:
+                ref.pop(i)
+
+        height, size = _check(t.head)
+        assert size == len(t) == len(ref)
+        assert t.height() == height
+        assert t.is_balanced()
+
+    assert t.inorder() == ref
+    assert t.height() <= 1.45 * math.log2(len(ref) + 2)
+
+
+def test_avl_sorted_inserts_stay_logarithmic():
+    t = AVLTree()
+    for i in range(1024):
+        t.append(i)
+    assert t.height() == 11
+    for i in range(0, 1024, 2):
+        t.delete(i)
+    _check(t.head)
+    assert t.inorder() == list(range(1, 1024, 2))
+
+
+def test_delete_missing_value_is_a_noop():
+    t = AVLTree.from_iterable([3, 1, 2])
+    t.delete(10)
+    assert len(t) == 3 and _check(t.head)[1] == 3
+
+
+@pytest.mark.parametrize("cls", [BinaryTree, AVLTree])
+def test_order_statistics_after_deletes(cls):
+    rnd = random.Random(42)
+    values = [rnd.randrange(100) for _ in range(300)]
+    t = cls()
+    for v in values:
+        t.append(v)
+    ref = sorted(values)
+    for v in values[::3]:
+        t.delete(v)
+        ref.remove(v)
+
+    _check(t.head)
+    assert [t.select(k) for k in range(len(ref))] == ref
+    for x in range(-1, 102):
+        assert t.rank(x) == bisect.bisect_left(ref, x)
+        assert t.count_range(x, x + 10) == bisect.bisect_right(ref, x + 10) - bisect.bisect_left(ref, x)
+    with pytest.raises(IndexError):
+        t.select(len(ref))
+
+
+def test_bulk_builds_cache_heights_and_sizes():
+    t = AVLTree.from_sorted(range(100))
+    _check(t.head)
+    t.merge(AVLTree.from_iterable([5, 500, -1]))
+    _check(t.head)
+    assert len(t) == 103 and t.is_balanced()
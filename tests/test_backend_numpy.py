@@ -0,0 +1,176 @@
+import math
+import random
+from array import array
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from rvtools.ml import (
+    Matrix,
+    Vector,
+    cdist,
+    get_backend,
+    mean_vector,
+    pairwise_distances,
+    use_backend,
+)
+
+
+def _ab(fn):
+    # run fn under both backends; the python result comes first
+    with use_backend("python"):
+        py = fn()
+    with use_backend("numpy"):
+        nump = fn()
+    return py, nump
+
+
+def _close(x, y):
+    if isinstance(x, float):
+        return math.isclose(x, y, rel_tol=1e-9, abs_tol=1e-9)
+    return len(x) == len(y) and all(_close(p, q) for p, q in zip(x, y))
+
+
+def _rand(rnd, n):
+    return [rnd.uniform(-5, 5) for _ in range(n)]
+
+
+def _rand_rows(rnd, r, c):
+    return [_rand(rnd, c) for _ in range(r)]
+
+
+def test_use_backend_restores_previous():
+    assert get_backend().name == "python"
+    with use_backend("numpy") as b:
+        assert b.name == "numpy"
+        assert get_backend() is b
+    assert get_backend().name == "python"
+
+
+@pytest.mark.parametrize("typed", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_vector_ops_agree(typed, seed):
+    rnd = random.Random(seed)
+    xs, ys = _rand(rnd, 17), _rand(rnd, 17)
+    s = rnd.uniform(-3, 3)
+
+    def run():
+        x, y = Vector(xs, typed=typed), Vector(ys, typed=typed)
+        out = [x + y, x - y, s * x, x * s]
+        return [(type(v._data), v.to_list()) for v in out], [
+            x.dot(y), x.l2_norm(), x.l1_norm(),
+            x.euclidean_distance(y), x.manhattan_distance(y), x.cosine_similarity(y),
+        ]
+
+    (py_vecs, py_scalars), (np_vecs, np_scalars) = _ab(run)
+    for (pt, pv), (nt, nv) in zip(py_vecs, np_vecs):
+        assert pt is nt
+        assert _close(pv, nv)
+        assert all(type(a) is float for a in nv)
+    assert _close(py_scalars, np_scalars)
+    assert all(type(a) is float for a in np_scalars)
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_inplace_ops_agree(typed):
+    rnd = random.Random(7)
+    xs, ys = _rand(rnd, 9), _rand(rnd, 9)
+
+    def run():
+        x = Vector(xs, typed=typed)
+        storage = x._data
+        x.iadd(Vector(ys)).isub([1.0] * 9).imul(0.5)
+        assert x._data is storage
+        return x.to_list()
+
+    py, nump = _ab(run)
+    assert _close(py, nump)
+
+
+def test_ops_on_wrapped_buffer():
+    buf = np.arange(6, dtype=np.float64)
+
+    def run():
+        v = Vector.from_buffer(buf.copy())
+        w = v + [1.0] * 6
+        return type(w._data), w.to_list(), v.dot(w)
+
+    (pt, pv, pd), (nt, nv, nd) = _ab(run)
+    assert pt is nt is array
+    assert _close(pv, nv) and _close(pd, nd)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matvec_and_matmat_agree(seed):
+    rnd = random.Random(seed)
+    a_rows = _rand_rows(rnd, 7, 5)
+    b_rows = _rand_rows(rnd, 5, 4)
+    c_rows = _rand_rows(rnd, 4, 5)
+    v = _rand(rnd, 5)
+
+    def run():
+        a, b, c = Matrix(a_rows), Matrix(b_rows), Matrix(c_rows)
+        return [
+            a.matvec(Vector(v)).to_list(),
+            a.T().matvec(Vector(_rand(random.Random(seed), 7))).to_list(),
+            (a @ b).to_lists(),
+            (a @ c.T()).to_lists(),         # transposed right operand
+            (c.T().T() @ a.T()).to_lists(),  # transposed left operand
+            a.T().T().add(a).to_lists(),
+            a.subtract(a).to_lists(),
+        ]
+
+    py, nump = _ab(run)
+    for p, n in zip(py, nump):
+        assert _close(p, n)
+
+
+def test_matmat_on_strided_views():
+    rnd = random.Random(3)
+    big = Matrix(_rand_rows(rnd, 6, 6))
+    # column-major view of a non-zero-offset block of big's storage
+    view = Matrix._from_flat(big._data, 3, 4, offset=7, rs=1, cs=6)
+
+    py, nump = _ab(lambda: (view @ view.T()).to_lists())
+    assert _close(py, nump)
+    assert _close(py, [[sum(view[i, k] * view[j, k] for k in range(4)) for j in range(3)] for i in range(3)])
+
+
+def test_mean_vector_agrees():
+    rnd = random.Random(11)
+    rows = _rand_rows(rnd, 20, 6)
+    vecs = [Vector(r, typed=i % 2 == 0) for i, r in enumerate(rows)]
+
+    py, nump = _ab(lambda: mean_vector(vecs))
+    assert _close(py, nump)
+    assert type(nump) is list and all(type(a) is float for a in nump)
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "sqeuclidean", "manhattan", "cosine"])
+def test_pairwise_agrees(metric):
+    rnd = random.Random(5)
+    X = _rand_rows(rnd, 13, 4)
+    Y = _rand_rows(rnd, 6, 4)
+
+    py, nump = _ab(lambda: pairwise_distances(X, metric=metric, chunk_size=4).to_lists())
+    assert _close(py, nump)
+    assert all(nump[i][i] == 0.0 for i in range(len(X)))
+
+    py, nump = _ab(lambda: cdist(X, Y, metric=metric, chunk_size=5).to_lists())
+    assert _close(py, nump)
+
+
+def test_numpy_wraps_typed_vectors_without_copying():
+    v = Vector([1, 2, 3], typed=True)
+    a = np.asarray(v)
+    a[1] = 20
+    assert v[1] == 20.0
+
+    b = np.zeros(3)
+    w = Vector.from_buffer(b)
+    w.iadd([1, 2, 3])
+    assert b.tolist() == [1.0, 2.0, 3.0]
+
+    with pytest.raises(ValueError):
+        Vector.from_buffer(np.zeros((2, 2)))
@@ -0,0 +1,205 @@
+import pytest
+
+from rvtools.ds import Cache, cached
+from rvtools.ml import Vector, euclidean_distance
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_order():
+    c = Cache(capacity=3)
+    for k in "abc":
+        c.put(k, k.upper())
+    c.get("a")              # b is now least recently used
+    c.put("d", "D")
+    assert "b" not in c
+    assert [k for k in "acd" if k in c] == ["a", "c", "d"]
+
+    c.put("c", "C2")        # overwriting refreshes recency
+    c.put("e", "E")
+    assert "a" not in c
+    assert c.get("c") == "C2"
+    assert c.evictions == 2
+
+
+def test_lfu_eviction_order():
+    c = Cache(capacity=3, policy="lfu")
+    for k in "abc":
+        c.put(k, k)
+    c.get("a")
+    c.get("a")
+    c.get("b")
+    c.put("d", "d")         # c has the lowest count
+    assert "c" not in c
+
+    c.put("e", "e")         # d (1 use) goes before a (3) and b (2)
+    assert "d" not in c
+    assert "a" in c and "b" in c and "e" in c
+
+
+def test_lfu_ties_evict_least_recent():
+    c = Cache(capacity=2, policy="lfu")
+    c.put("a", 1)
+    c.put("b", 2)
+    c.put("c", 3)
+    assert "a" not in c
+    assert "b" in c and "c" in c
+
+
+def test_lfu_min_bucket_after_touch():
+    # touching the only entry at the minimum frequency must advance the
+    # minimum, so the next eviction comes from the next bucket up
+    c = Cache(capacity=2, policy="lfu")
+    c.put("a", 1)
+    c.get("a")
+    c.get("a")              # a: 3
+    c.put("b", 2)
+    c.get("b")              # b: 2, bucket 1 is now empty
+    c.put("c", 3)
+    assert "b" not in c
+    assert "a" in c and "c" in c
+
+    # deleting the minimum entry leaves the bucket map sparse
+    c.delete("c")
+    c.put("d", 4)
+    c.put("e", 5)
+    assert "d" not in c
+    assert "a" in c and "e" in c
+
+
+def test_size_fn():
+    c = Cache(capacity=10, size_fn=len)
+    c.put("a", "xxxx")
+    c.put("b", "xxxx")
+    assert c.stats()["size"] == 8
+
+    c.put("c", "xxxx")      # needs 4 more, evicts a
+    assert "a" not in c
+    assert c.stats()["size"] == 8
+
+    c.put("big", "x" * 11)  # larger than capacity: left uncached
+    assert "big" not in c
+    assert "b" in c and "c" in c
+
+
+def test_ttl_with_injected_timer():
+    clock = Clock()
+    c = Cache(capacity=4, ttl=5, timer=clock)
+    c.put("a", 1)
+    clock.now = 3
+    c.put("b", 2)
+    assert c.get("a") == 1
+
+    clock.now = 5
+    assert "a" not in c
+    assert c.get("a") is None
+    assert c.get("b") == 2
+    assert c.expirations == 1
+    assert len(c) == 1
+
+    c.put("a", 10)          # refreshed expiry
+    clock.now = 9
+    assert c.get("a") == 10
+    assert "b" not in c
+
+
+def test_counters():
+    c = Cache(capacity=1)
+    assert c.get("x", "dflt") == "dflt"
+    c.put("x", 1)
+    assert c.get("x") == 1
+    c.put("y", 2)
+
+    s = c.stats()
+    assert (s["hits"], s["misses"], s["evictions"]) == (1, 1, 1)
+    assert s["hit_rate"] == 0.5
+    assert s["entries"] == 1
+
+
+def test_delete_and_clear():
+    c = Cache(capacity=3)
+    c.put("a", 1)
+    c.delete("a")
+    with pytest.raises(KeyError):
+        c.delete("a")
+
+    c.put("b", 2)
+    c.clear()
+    assert len(c) == 0
+    c.put("c", 3)
+    assert c.get("c") == 3
+
+
+def test_bad_args():
+    with pytest.raises(ValueError):
+        Cache(capacity=0)
+    with pytest.raises(ValueError):
+        Cache(policy="fifo")
+
+
+def test_cached_kwargs_keys():
+    calls = []
+
+    @cached()
+    def f(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls)
+
+    # a positional tuple that looks like a kwargs item must not collide
+    assert f(("a", 1)) == 1
+    assert f(a=1) == 2
+    assert f(a=1) == 2
+    assert f(b=2, a=1) == f(a=1, b=2) == 3
+    assert f.cache.hits == 2
+
+
+def test_cached_unhashable_args_skip_cache():
+    assert cached()(euclidean_distance)([0, 0], [3, 4]) == 5.0
+
+    calls = []
+
+    @cached()
+    def total(xs):
+        calls.append(xs)
+        return sum(xs)
+
+    assert total([1, 2]) == 3
+    assert total([1, 2]) == 3
+    assert len(calls) == 2
+    assert len(total.cache) == 0
+
+
+def test_cached_key_function():
+    calls = []
+
+    @cached(key=lambda v: tuple(v))
+    def norm(v):
+        calls.append(v)
+        return v.l2_norm()
+
+    v = Vector([3, 4])
+    assert norm(v) == 5.0
+    assert norm(Vector([3, 4])) == 5.0
+    assert len(calls) == 1
+
+    # keyed on contents, so mutating v is not served a stale result
+    v[0] = 0
+    assert norm(v) == 4.0
+
+
+def test_cached_clear():
+    @cached(capacity=2)
+    def sq(x):
+        return x * x
+
+    sq(2)
+    sq(3)
+    assert len(sq.cache) == 2
+    sq.cache_clear()
+    assert len(sq.cache) == 0
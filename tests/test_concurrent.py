@@ -0,0 +1,185 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from rvtools.ds import AsyncQueue, AsyncStack, ConcurrentQueue, ConcurrentStack
+
+
+def test_queue_get_blocks_until_put():
+    q = ConcurrentQueue()
+    got = []
+    t = threading.Thread(target=lambda: got.append(q.get(timeout=5)))
+    t.start()
+    time.sleep(0.05)
+    assert got == []
+    q.put("x")
+    t.join(5)
+    assert got == ["x"]
+
+
+def test_queue_put_blocks_when_full():
+    q = ConcurrentQueue(capacity=1)
+    q.put(1)
+    done = threading.Event()
+
+    def producer():
+        q.put(2, timeout=5)
+        done.set()
+
+    t = threading.Thread(target=producer)
+    t.start()
+    assert not done.wait(0.05)
+    assert q.get() == 1
+    t.join(5)
+    assert done.is_set() and q.get() == 2
+
+
+def test_queue_timeouts():
+    q = ConcurrentQueue(capacity=1)
+    with pytest.raises(TimeoutError):
+        q.get(timeout=0.01)
+    with pytest.raises(TimeoutError):
+        q.get_many(3, timeout=0.01)
+    q.put(1)
+    with pytest.raises(TimeoutError):
+        q.put(2, timeout=0.01)
+    with pytest.raises(TimeoutError):
+        q.put_many([2, 3], timeout=0.01)
+    with pytest.raises(IndexError):
+        q.put(2, block=False)
+
+
+def test_queue_put_many_partial_timeout():
+    q = ConcurrentQueue(capacity=3)
+    q.put(0)
+    with pytest.raises(TimeoutError) as exc:
+        q.put_many([1, 2, 3, 4], timeout=0.01)
+    # what fit stays queued, and the error says how much that was
+    assert exc.value.enqueued == 2
+    assert q.get_many(5) == [0, 1, 2]
+
+    with pytest.raises(TimeoutError) as exc:
+        q.put_many(range(10), timeout=0.01)
+    assert exc.value.enqueued == 3
+
+
+def test_queue_batches_across_threads():
+    q = ConcurrentQueue(capacity=8)
+    n = 1000
+    received = []
+
+    def consumer():
+        while len(received) < n:
+            received.extend(q.get_many(16, timeout=5))
+
+    t = threading.Thread(target=consumer)
+    t.start()
+    # put_many waits for room in chunks, so it can push more than capacity
+    q.put_many(range(n), timeout=5)
+    t.join(5)
+    assert received == list(range(n))
+    assert q.is_empty()
+
+
+def test_queue_many_producers_and_consumers():
+    q = ConcurrentQueue(capacity=4)
+    out = []
+    lock = threading.Lock()
+
+    def produce(base):
+        for i in range(200):
+            q.put(base + i, timeout=5)
+
+    def consume():
+        for _ in range(200):
+            v = q.get(timeout=5)
+            with lock:
+                out.append(v)
+
+    threads = [threading.Thread(target=produce, args=(k * 1000,)) for k in range(4)]
+    threads += [threading.Thread(target=consume) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    assert sorted(out) == sorted(k * 1000 + i for k in range(4) for i in range(200))
+
+
+def test_stack_batches_and_blocking_get():
+    s = ConcurrentStack()
+    s.push_many([1, 2, 3])
+    assert s.pop_many(2) == [3, 2]
+    assert s.pop_many(5) == [1]
+    with pytest.raises(TimeoutError):
+        s.get(timeout=0.01)
+
+    got = []
+    t = threading.Thread(target=lambda: got.append(s.get(timeout=5)))
+    t.start()
+    time.sleep(0.05)
+    s.push("x")
+    t.join(5)
+    assert got == ["x"]
+
+
+def test_async_queue_put_get_and_timeout():
+    async def main():
+        q = AsyncQueue(capacity=1)
+        getter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        await q.put(1)
+        assert await getter == 1
+
+        await q.put(2)
+        with pytest.raises(TimeoutError):
+            await q.put(3, timeout=0.01)
+        assert await q.get() == 2
+        with pytest.raises(TimeoutError):
+            await q.get(timeout=0.01)
+
+    asyncio.run(main())
+
+
+def test_async_queue_cancelled_waiter_hands_off_wakeup():
+    async def main():
+        q = AsyncQueue()
+        first = asyncio.create_task(q.get())
+        second = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+
+        # the wakeup goes to `first`, which is cancelled before it resumes;
+        # the item must not be stranded with `second` still waiting
+        q.enqueue("x")
+        first.cancel()
+        assert await asyncio.wait_for(second, 1) == "x"
+        assert first.cancelled()
+        assert q.is_empty()
+
+    asyncio.run(main())
+
+
+def test_async_queue_timed_out_waiter_is_dropped():
+    async def main():
+        q = AsyncQueue()
+        with pytest.raises(TimeoutError):
+            await q.get(timeout=0.01)
+        waiter = asyncio.create_task(q.get())
+        await asyncio.sleep(0)
+        q.enqueue("y")
+        assert await asyncio.wait_for(waiter, 1) == "y"
+
+    asyncio.run(main())
+
+
+def test_async_stack_get_waits_for_push():
+    async def main():
+        s = AsyncStack()
+        getter = asyncio.create_task(s.get())
+        await asyncio.sleep(0)
+        s.push_many([1, 2])
+        assert await getter == 2
+        assert s.pop() == 1
+
+    asyncio.run(main())
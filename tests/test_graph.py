@@ -0,0 +1,408 @@
+import math
+import random
+
+import pytest
+
+from rvtools.ds import Graph
+
+INF = float("inf")
+
+
+def _random_graph(rnd):
+    n = rnd.randint(1, 8)
+    directed = rnd.random() < 0.5
+    edges = [(rnd.randrange(n), rnd.randrange(n), rnd.randint(0, 9)) for _ in range(rnd.randint(0, 16))]
+    g = Graph(directed=directed)
+    for v in range(n):
+        g.add_vertex(v)
+    for a, b, w in edges:
+        g.add_edge(a, b, w)
+    return g, n, edges, directed
+
+
+def _brute_distances(n, edges, source, directed):
+    # Bellman-Ford: n rounds of relaxing every edge
+    dist = [INF] * n
+    dist[source] = 0
+    for _ in range(n):
+        for a, b, w in edges:
+            dist[b] = min(dist[b], dist[a] + w)
+            if not directed:
+                dist[a] = min(dist[a], dist[b] + w)
+    return dist
+
+
+def _path_cost(path, edges, directed):
+    def weight(a, b):
+        return min(
+            w for x, y, w in edges
+            if (x, y) == (a, b) or (not directed and (y, x) == (a, b))
+        )
+    return sum(weight(a, b) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_dijkstra_matches_brute_force(seed):
+    rnd = random.Random(seed)
+    for _ in range(300):
+        g, n, edges, directed = _random_graph(rnd)
+        s, t = rnd.randrange(n), rnd.randrange(n)
+        ref = _brute_distances(n, edges, s, directed)
+
+        dist = g.dijkstra(s)
+        assert {v: dist.get(v, INF) for v in range(n)} == dict(enumerate(ref))
+
+        path, cost = g.dijkstra(s, t)
+        assert cost == ref[t]
+        if cost == INF:
+            assert path == []
+        else:
+            assert path[0] == s and path[-1] == t
+            assert _path_cost(path, edges, directed) == cost
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_astar_optimal_with_inconsistent_admissible_heuristic(seed):
+    rnd = random.Random(seed)
+    for _ in range(300):
+        g, n, edges, directed = _random_graph(rnd)
+        s, t = rnd.randrange(n), rnd.randrange(n)
+        # exact remaining cost from each vertex, then shrink it at random:
+        # admissible, but usually not consistent
+        to_goal = [_brute_distances(n, edges, v, directed)[t] for v in range(n)]
+        h = {v: 0 if to_goal[v] == INF else rnd.uniform(0, to_goal[v]) for v in range(n)}
+
+        path, cost = g.astar(s, t, lambda v, goal: h[v])
+        assert cost == to_goal[s]
+        if cost != INF:
+            assert path[0] == s and path[-1] == t
+            assert _path_cost(path, edges, directed) == cost
+
+
+def test_astar_reopens_vertex_reached_cheaper_later():
+    # h(2) = 6 is admissible (true cost 9) but not consistent, so vertex 1
+    # is first expanded via the direct 0 -> 1 edge at cost 4 and must be
+    # reopened once 0 -> 2 -> 1 reaches it at cost 2
+    g = Graph(directed=True)
+    for v in range(4):
+        g.add_vertex(v)
+    for a, b, w in [(0, 1, 4), (0, 2, 1), (2, 1, 1), (1, 3, 8)]:
+        g.add_edge(a, b, w)
+    h = {0: 0, 1: 0, 2: 6, 3: 0}
+
+    assert g.astar(0, 3, lambda v, goal: h[v]) == ([0, 2, 1, 3], 10)
+
+
+def test_astar_on_grid_with_manhattan_heuristic():
+    g = Graph()
+    size = 6
+    walls = {(1, 1), (1, 2), (1, 3), (3, 2), (3, 3), (3, 4), (3, 5)}
+    cells = [(x, y) for x in range(size) for y in range(size) if (x, y) not in walls]
+    for c in cells:
+        g.add_vertex(c)
+    for x, y in cells:
+        for nb in ((x + 1, y), (x, y + 1)):
+            if nb in g.vertices:
+                g.add_edge((x, y), nb)
+
+    def manhattan(c, goal):
+        return abs(c[0] - goal[0]) + abs(c[1] - goal[1])
+
+    path, cost = g.astar((0, 0), (5, 5), manhattan)
+    assert cost == g.dijkstra((0, 0), (5, 5))[1] == 10
+    assert len(path) == cost + 1
+
+
+def test_unreachable_and_missing_vertices():
+    g = Graph(directed=True)
+    for v in "abc":
+        g.add_vertex(v)
+    g.add_edge("a", "b", 2)
+    assert g.dijkstra("b", "a") == ([], INF)
+    assert g.astar("a", "c", lambda v, goal: 0) == ([], INF)
+    assert g.astar("a", "zz", lambda v, goal: 0) == ([], INF)
+    assert g.dijkstra("a") == {"a": 0, "b": 2}
+
+
+def test_negative_weight_raises():
+    g = Graph(directed=True)
+    g.add_vertex(0)
+    g.add_vertex(1)
+    g.add_edge(0, 1, -1)
+    with pytest.raises(ValueError):
+        g.dijkstra(0)
+
+
+def test_float_weights():
+    g = Graph()
+    for v in range(3):
+        g.add_vertex(v)
+    g.add_edge(0, 1, 0.1)
+    g.add_edge(1, 2, 0.2)
+    g.add_edge(0, 2, 0.5)
+    path, cost = g.dijkstra(0, 2)
+    assert path == [0, 1, 2] and math.isclose(cost, 0.3)
+
+
+def _edge_tuples(g):
+    return sorted((e.start.id, e.end.id, e.weight) for e in g.edges)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("keep_edges", [False, True])
+def test_from_edges_matches_add_edge(directed, keep_edges):
+    edges = [("a", "b"), ("b", "c", 2.5), ("c", "a", 3), ("d", "d")]
+    g = Graph.from_edges(edges, directed=directed, keep_edges=keep_edges)
+
+    ref = Graph(directed=directed)
+    for item in edges:
+        for vid in item[:2]:
+            ref.add_vertex(vid)
+        ref.add_edge(*item)
+
+    assert list(g.vertices) == ["a", "b", "c", "d"]
+    assert _edge_tuples(g) == _edge_tuples(ref)
+    assert g._edge_count == len(g.edges)
+    for vid in g.vertices:
+        assert [v.id for v in g.outgoing(vid)] == [v.id for v in ref.outgoing(vid)]
+        assert [v.id for v in g.incoming(vid)] == [v.id for v in ref.incoming(vid)]
+
+
+def test_add_edge_on_bulk_loaded_graph_stays_lazy():
+    g = Graph.from_edges([(0, 1), (1, 2)], directed=True)
+    e = g.add_edge(2, 0, 5)
+    assert g._edges is None
+
+    edges = g.edges
+    assert e in edges
+    assert sum(1 for x in edges if x is e) == 1
+    assert _edge_tuples(g) == [(0, 1, 1), (1, 2, 1), (2, 0, 5)]
+
+    # once materialized, new edges are appended directly
+    e2 = g.add_edge(0, 2)
+    assert g.edges[-1] is e2
+    assert len(g.edges) == g._edge_count == 4
+
+
+def test_add_edge_undirected_bulk_loaded():
+    g = Graph.from_edges([("x", "y")])
+    g.add_vertex("z")
+    e = g.add_edge("y", "z", 2)
+    assert any(x is e for x in g.edges)
+    assert _edge_tuples(g) == [("x", "y", 1), ("y", "x", 1), ("y", "z", 2), ("z", "y", 2)]
+
+
+def _write(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return path
+
+
+def test_from_file_csv_with_header_and_comments(tmp_path):
+    path = _write(tmp_path, "g.csv", "src,dst,w\n# comment\n1,2,0.5\n\n2, 3,1\n  # indented comment\n3,1\n")
+    g = Graph.from_file(path, directed=True, vertex_type=int, skip_header=True)
+    assert list(g.vertices) == [1, 2, 3]
+    assert _edge_tuples(g) == [(1, 2, 0.5), (2, 3, 1.0), (3, 1, 1)]
+
+
+def test_from_file_tsv_and_whitespace(tmp_path):
+    tsv = _write(tmp_path, "g.tsv", "a\tb\t2\nb\tc\n")
+    g = Graph.from_file(tsv)
+    assert _edge_tuples(g) == [("a", "b", 2.0), ("b", "a", 2.0), ("b", "c", 1), ("c", "b", 1)]
+
+    txt = _write(tmp_path, "g.txt", "a   b\n\n% skipped\nb\tc  3\n")
+    g = Graph.from_file(txt, directed=True, comment="%")
+    assert _edge_tuples(g) == [("a", "b", 1), ("b", "c", 3.0)]
+
+
+def test_from_file_explicit_delimiter_and_keep_edges(tmp_path):
+    path = _write(tmp_path, "g.dat", "0;1;4\n1;2;1\n")
+    g = Graph.from_file(path, directed=True, delimiter=";", vertex_type=int, keep_edges=True)
+    assert g._edges is not None
+    assert _edge_tuples(g) == [(0, 1, 4.0), (1, 2, 1.0)]
+    assert g.dijkstra(0, 2) == ([0, 1, 2], 5.0)
+
+
+@pytest.mark.parametrize("name, text, lineno", [
+    ("bad.csv", "a,b\nc\n", 2),
+    ("bad.txt", "# header\na b c d\n", 2),
+])
+def test_from_file_bad_field_count(tmp_path, name, text, lineno):
+    path = _write(tmp_path, name, text)
+    with pytest.raises(ValueError, match=f"Line {lineno}"):
+        Graph.from_file(path)
+
+
+def _two_islands():
+    # 0 -> 1 -> 2 -> 0, 3 <-> 4, and an isolated 5
+    g = Graph.from_edges([(0, 1), (1, 2), (2, 0), (3, 4), (4, 3)], directed=True)
+    g.add_vertex(5)
+    return g
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bfs_many_matches_serial_bfs(workers):
+    g = _two_islands()
+    csr = g.freeze()
+    sources = [0, 3, 5, 2, 4, 1]
+
+    rows = list(g.bfs_many(sources, workers=workers, chunksize=1))
+    csr_rows = list(csr.bfs_many(sources, workers=workers))
+    assert [sid for sid, _ in rows] == [sid for sid, _ in csr_rows] == sources
+
+    for (sid, row), (_, csr_row) in zip(rows, csr_rows):
+        assert list(row) == list(csr_row) == list(csr.bfs_distances(sid))
+        reachable = set(g.bfs(sid))
+        for vid, d in zip(csr.ids, row):
+            assert (d == -1) == (vid not in reachable)
+
+    assert list(dict(rows)[0]) == [0, 1, 2, -1, -1, -1]
+    assert list(dict(rows)[5]) == [-1, -1, -1, -1, -1, 0]
+
+
+def _random_unweighted(rnd, directed):
+    n = rnd.randint(1, 12)
+    g = Graph(directed=directed)
+    for v in range(n):
+        g.add_vertex(v)
+    for _ in range(rnd.randint(0, 3 * n)):
+        g.add_edge(rnd.randrange(n), rnd.randrange(n))
+    return g, n
+
+
+def _is_path(g, path):
+    return all(b in {v.id for v in g.outgoing(a)} for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_bidirectional_bfs_matches_bfs(directed, seed):
+    rnd = random.Random(seed)
+    for _ in range(300):
+        g, n = _random_unweighted(rnd, directed)
+        s, t = rnd.randrange(n), rnd.randrange(n)
+        ref = g.shortest_path_bfs(s, t)
+        path = g.shortest_path_bfs(s, t, bidirectional=True)
+
+        assert len(path) == len(ref)
+        if path:
+            assert path[0] == s and path[-1] == t
+            assert _is_path(g, path)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_multi_source_bfs_matches_nearest_source(directed, seed):
+    rnd = random.Random(seed)
+    for _ in range(200):
+        g, n = _random_unweighted(rnd, directed)
+        sources = rnd.sample(range(n), rnd.randint(1, n))
+        expected = {}
+        for s in sources:
+            for v in range(n):
+                path = g.shortest_path_bfs(s, v)
+                if path:
+                    expected[v] = min(len(path) - 1, expected.get(v, n))
+
+        # unknown sources are ignored
+        dist = g.multi_source_bfs(sources + [n + 100])
+        assert dist == expected
+
+        goal = rnd.randrange(n)
+        path = g.multi_source_bfs(sources, goal)
+        if goal in dist:
+            assert len(path) == dist[goal] + 1
+            assert path[0] in sources and path[-1] == goal
+            assert _is_path(g, path)
+        else:
+            assert path == []
+
+
+def _reachable(g, vid):
+    return set(g.bfs(vid))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_scc_matches_mutual_reachability(seed):
+    rnd = random.Random(seed)
+    for _ in range(150):
+        g, n = _random_unweighted(rnd, directed=True)
+        reach = {v: _reachable(g, v) for v in range(n)}
+        comps = g.strongly_connected_components()
+
+        assert sorted(v for c in comps for v in c) == list(range(n))
+        comp_of = {v: i for i, c in enumerate(comps) for v in c}
+        for u in range(n):
+            for v in range(n):
+                assert (comp_of[u] == comp_of[v]) == (v in reach[u] and u in reach[v])
+
+        # reverse topological order: edges never point to a later component
+        for u in range(n):
+            for w in g.outgoing(u):
+                assert comp_of[w.id] <= comp_of[u]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_connected_components_match_reachability(directed, seed):
+    rnd = random.Random(seed)
+    for _ in range(150):
+        g, n = _random_unweighted(rnd, directed)
+        undirected = Graph()
+        for v in range(n):
+            undirected.add_vertex(v)
+        for e in g.edges:
+            undirected.add_edge(e.start.id, e.end.id)
+
+        comps = g.connected_components()
+        assert sorted(v for c in comps for v in c) == list(range(n))
+        assert [c[0] for c in comps] == sorted(c[0] for c in comps)
+        for c in comps:
+            assert set(c) == _reachable(undirected, c[0])
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_topological_sort_orders_edges_or_detects_cycle(seed):
+    rnd = random.Random(seed)
+    for _ in range(200):
+        n = rnd.randint(1, 12)
+        g = Graph(directed=True)
+        for v in range(n):
+            g.add_vertex(v)
+        for _ in range(rnd.randint(0, 2 * n)):
+            a, b = rnd.randrange(n), rnd.randrange(n)
+            # mostly forward edges so both outcomes are common
+            if a > b and rnd.random() < 0.9:
+                a, b = b, a
+            g.add_edge(a, b)
+
+        has_cycle = any(len(c) > 1 for c in g.strongly_connected_components()) or any(
+            v in {w.id for w in g.outgoing(v)} for v in range(n))
+        if has_cycle:
+            with pytest.raises(ValueError):
+                g.topological_sort()
+            continue
+
+        order = g.topological_sort()
+        assert sorted(order) == list(range(n))
+        pos = {v: i for i, v in enumerate(order)}
+        for e in g.edges:
+            assert pos[e.start.id] < pos[e.end.id]
+
+
+def test_topological_sort_rejects_undirected():
+    with pytest.raises(ValueError):
+        Graph.from_edges([(0, 1)]).topological_sort()
+
+
+def test_deep_chain_is_recursion_free():
+    n = 100_000
+    chain = Graph.from_edges(((i, i + 1) for i in range(n - 1)), directed=True)
+    assert chain.topological_sort() == list(range(n))
+    assert len(chain.strongly_connected_components()) == n
+    assert len(chain.connected_components()) == 1
+
+    cycle = Graph.from_edges(((i, (i + 1) % n) for i in range(n)), directed=True)
+    assert [len(c) for c in cycle.strongly_connected_components()] == [n]
+    with pytest.raises(ValueError):
+        cycle.topological_sort()
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from rvtools.ds import HashMap
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_two_way_lookups(compact):
+    hm = HashMap(compact=compact)
+    hm.append("a", 3)
+    hm.append(("b", 0))
+    assert hm.get_val("a") == 3 and hm.get_key(0) == "b"
+    assert hm.get_vals(["a", "b", "z"]) == [3, 0, None]
+    assert hm.get_keys([0, 3, 1, 99]) == ["b", "a", None, None]
+
+    with pytest.raises(KeyError):
+        hm.append("a", 5)
+    with pytest.raises(KeyError):
+        hm.append("c", 3)
+
+    hm.remove_key("a")
+    assert hm.get_key(3) is None and "a" not in hm
+    hm.remove_val(0)
+    assert len(hm) == 0
+    with pytest.raises(KeyError):
+        hm.remove_key("a")
+    with pytest.raises(KeyError):
+        hm.remove_val(0)
+
+    # a freed value can be reused
+    hm.append("c", 3)
+    assert hm.get_key(3) == "c"
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_compact_matches_dict_mode(seed):
+    rnd = random.Random(seed)
+    plain, compact = HashMap(), HashMap(compact=True)
+    for _ in range(500):
+        k, v = rnd.randrange(40), rnd.randrange(40)
+        r = rnd.random()
+        for hm in (plain, compact):
+            if r < 0.6:
+                try:
+                    hm.append(k, v)
+                except KeyError:
+                    pass
+            elif r < 0.8 and k in hm:
+                hm.remove_key(k)
+            elif v in [hm.get_val(x) for x in hm.keys()]:
+                hm.remove_val(v)
+        assert dict(plain.items()) == dict(compact.items())
+        assert plain.get_keys(range(45)) == compact.get_keys(range(45))
+
+
+@pytest.mark.parametrize("bad", [-1, 1.0, "1", True, False])
+def test_compact_rejects_non_index_values(bad):
+    with pytest.raises(ValueError):
+        HashMap(compact=True).append("k", bad)
+    with pytest.raises(ValueError):
+        HashMap.from_pairs([("k", bad)], compact=True)
+
+    hm = HashMap.from_pairs([("zero", 0), ("one", 1)], compact=True)
+    assert hm.get_key(bad) is None
+    with pytest.raises(KeyError):
+        hm.remove_val(bad)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_from_pairs(compact):
+    pairs = [("a", 2), ("b", 0), ("c", 5)]
+    hm = HashMap.from_pairs(iter(pairs), compact=compact)
+    assert list(hm.items()) == pairs
+    assert hm.get_keys([0, 2, 5]) == ["b", "a", "c"]
+
+    with pytest.raises(KeyError):
+        HashMap.from_pairs([("a", 1), ("a", 2)], compact=compact)
+    with pytest.raises(KeyError):
+        HashMap.from_pairs([("a", 1), ("b", 1)], compact=compact)
+
+    assert len(HashMap.from_pairs([], compact=compact)) == 0
+
+
+def test_from_pairs_rejects_none_values():
+    with pytest.raises(ValueError):
+        HashMap.from_pairs([("a", None)])
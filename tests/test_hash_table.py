@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from rvtools.ds import HashTable
+
+
+class BadHash:
+    # every instance collides, forcing long probe chains
+    def __init__(self, v):
+        self.v = v
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, BadHash) and self.v == other.v
+
+
+def test_basic_ops():
+    t = HashTable()
+    t["a"] = 1
+    t.put("b", 2)
+    t["a"] = 3
+    assert t["a"] == 3 and t.get("b") == 2 and t.get("zz", 0) == 0
+    assert len(t) == 2 and "a" in t and "zz" not in t
+    assert t.remove("a") == 3
+    with pytest.raises(KeyError):
+        t["a"]
+    with pytest.raises(KeyError):
+        del t["a"]
+
+
+def test_invalid_load_factor():
+    with pytest.raises(ValueError):
+        HashTable(load_factor=1.0)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_interleaved_ops_during_migration(seed):
+    rnd = random.Random(seed)
+    t = HashTable(capacity=1)
+    ref = {}
+    saw_resizing = False
+
+    for _ in range(5000):
+        k = rnd.randrange(300)
+        op = rnd.random()
+        if op < 0.5:
+            t[k] = op
+            ref[k] = op
+        elif op < 0.8:
+            if k in ref:
+                assert t.remove(k) == ref.pop(k)
+            else:
+                with pytest.raises(KeyError):
+                    t.remove(k)
+        else:
+            assert t.get(k, None) == ref.get(k)
+
+        saw_resizing |= t.stats()["resizing"]
+        assert len(t) == len(ref)
+
+    assert saw_resizing
+    assert dict(t.items()) == ref
+    assert sorted(t) == sorted(ref)
+
+
+def test_tombstones_are_compacted():
+    t = HashTable()
+    for i in range(1000):
+        t[i] = i
+        del t[i]
+    stats = t.stats()
+    assert len(t) == 0
+    # churn reuses and rebuilds the table instead of growing it
+    assert stats["capacity"] <= 64
+
+    for i in range(100):
+        t[i] = i
+    t.compact()
+    stats = t.stats()
+    assert stats["tombstones"] == 0 and not stats["resizing"]
+    assert all(t[i] == i for i in range(100))
+
+
+def test_colliding_keys():
+    t = HashTable()
+    keys = [BadHash(i) for i in range(50)]
+    for i, k in enumerate(keys):
+        t[k] = i
+    for k in keys[::2]:
+        del t[k]
+    assert all(t.get(k) == k.v for k in keys[1::2])
+    assert all(k not in t for k in keys[::2])
+    assert t.stats()["max_probe"] > 0
+
+
+def test_clear():
+    t = HashTable()
+    for i in range(100):
+        t[i] = i
+    t.clear()
+    assert len(t) == 0 and list(t) == []
+    t[1] = 1
+    assert t[1] == 1
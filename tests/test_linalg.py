@@ -0,0 +1,177 @@
+import math
+import random
+from array import array
+
+import pytest
+
+from rvtools.ml import Matrix, Vector
+
+
+def _rand_rows(rnd, r, c):
+    return [[rnd.uniform(-5, 5) for _ in range(c)] for _ in range(r)]
+
+
+def _ref_matmul(a, b):
+    return [[sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))] for i in range(len(a))]
+
+
+def _close(x, y):
+    return all(math.isclose(p, q, rel_tol=1e-9, abs_tol=1e-9) for rx, ry in zip(x, y) for p, q in zip(rx, ry))
+
+
+def test_transpose_is_a_view():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    t = m.T()
+    assert t.shape == (3, 2)
+    assert t.to_lists() == [[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]]
+    assert t._data is m._data
+    assert t.T().to_lists() == m.to_lists()
+
+    t[2, 1] = 60
+    assert m[1, 2] == 60
+
+
+def test_row_and_column_views_write_through():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    row, col = m.row(1), m.col(2)
+    assert row.tolist() == [4.0, 5.0, 6.0]
+    assert col.tolist() == [3.0, 6.0]
+
+    row[0] = 40
+    col[0] = 30
+    m[0][1] = 20
+    assert m.to_lists() == [[1.0, 20.0, 30.0], [40.0, 5.0, 6.0]]
+    assert m.T().row(2).tolist() == [30.0, 6.0]
+    assert m.T().col(0).tolist() == [1.0, 20.0, 30.0]
+
+
+def test_indexing_and_assignment():
+    m = Matrix([[1, 2], [3, 4], [5, 6]])
+    assert m[-1, -1] == 6 and m[-1][0] == 5
+    assert [r.tolist() for r in m[1:]] == [[3.0, 4.0], [5.0, 6.0]]
+    m[1] = [7, 8]
+    assert m.to_lists()[1] == [7.0, 8.0]
+    with pytest.raises(ValueError):
+        m[0] = [1]
+    with pytest.raises(IndexError):
+        m[3]
+    with pytest.raises(IndexError):
+        m[0, 2]
+    with pytest.raises(ValueError):
+        Matrix([[1, 2], [3]])
+
+
+def test_copy_is_contiguous_and_independent():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    c = m.T().copy()
+    assert c._contiguous() and c.to_lists() == m.T().to_lists()
+    c[0, 0] = 99
+    assert m[0, 0] == 1
+    assert Matrix(m).to_lists() == m.to_lists()
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matmat_with_transposed_operands(seed):
+    rnd = random.Random(seed)
+    for _ in range(30):
+        # widths past the 64-column tile exercise the blocked loop
+        r, k, c = rnd.randint(1, 8), rnd.randint(1, 8), rnd.randint(1, 150)
+        a, b = _rand_rows(rnd, r, k), _rand_rows(rnd, k, c)
+        ma, mb = Matrix(a), Matrix(b)
+        at = [list(col) for col in zip(*a)]
+        bt = [list(col) for col in zip(*b)]
+
+        assert _close((ma @ mb).to_lists(), _ref_matmul(a, b))
+        assert _close((Matrix(at).T() @ Matrix(bt).T()).to_lists(), _ref_matmul(a, b))
+        assert _close((ma @ ma.T()).to_lists(), _ref_matmul(a, at))
+        assert _close((mb.T() @ ma.T()).to_lists(), _ref_matmul(bt, at))
+
+
+def test_matvec_and_elementwise_on_views():
+    rnd = random.Random(7)
+    a = _rand_rows(rnd, 4, 3)
+    m = Matrix(a)
+    v = [rnd.uniform(-1, 1) for _ in range(4)]
+    expected = [sum(a[i][j] * v[i] for i in range(4)) for j in range(3)]
+    got = (m.T() @ Vector(v, typed=True)).to_list()
+    assert all(math.isclose(x, y) for x, y in zip(got, expected))
+
+    total = m.T().add(m.T())
+    assert total.to_lists() == [[2 * x for x in col] for col in zip(*a)]
+    assert m.T().subtract(m.T()).to_lists() == [[0.0] * 4 for _ in range(3)]
+    with pytest.raises(ValueError):
+        m.add(m.T())
+    with pytest.raises(ValueError):
+        m @ Matrix([[1.0]])
+
+
+def test_augmented_assignment_rebinds():
+    v = Vector([1, 2], typed=True)
+    alias = v
+    v += Vector([10, 20])
+    v -= [1, 1]
+    v *= 2
+    assert v.to_list() == [20.0, 42.0]
+    assert alias.to_list() == [1.0, 2.0]
+
+    w = Vector([1, 2])
+    storage = w._data
+    assert w.iadd([1, 1]).isub([0, 1]).imul(3) is w
+    assert w._data is storage
+    assert w.to_list() == [6, 6]
+
+
+def test_from_buffer_writes_through():
+    data = array("d", [1.0, 2.0, 3.0])
+    v = Vector.from_buffer(data)
+    assert v.typed
+
+    v[0] = 10
+    v.iadd([1, 1, 1])
+    assert data.tolist() == [11.0, 3.0, 4.0]
+
+    data[2] = 40
+    assert v[2] == 40.0
+
+    # a typed Vector's buffer is shared too
+    w = Vector.from_buffer(v)
+    w.imul(0.5)
+    assert data.tolist() == [5.5, 1.5, 20.0]
+
+
+def test_from_buffer_reinterprets_bytes():
+    raw = bytearray(array("d", [1.5, -2.0]).tobytes())
+    v = Vector.from_buffer(raw)
+    assert v.to_list() == [1.5, -2.0]
+
+    v[1] = 8.0
+    assert array("d", bytes(raw)).tolist() == [1.5, 8.0]
+
+
+def test_from_buffer_rejects_bad_input():
+    with pytest.raises(ValueError):
+        Vector.from_buffer(array("f", [1.0, 2.0]))
+    with pytest.raises(ValueError):
+        Vector.from_buffer(array("i", [1, 2]))
+    with pytest.raises(ValueError):
+        Vector.from_buffer(memoryview(array("d", [1.0] * 6)).cast("B").cast("d", (2, 3)))
+
+
+def test_from_buffer_copies_list_vectors():
+    src = Vector([1, 2])
+    v = Vector.from_buffer(src)
+    v[0] = 5
+    assert src.to_list() == [1, 2]
+
+
+def test_array_interface():
+    v = Vector([1, 2, 3], typed=True)
+    ai = v.__array_interface__
+    address, length = v._data.buffer_info()
+    assert ai["shape"] == (3,)
+    assert ai["data"] == (address, False)
+    assert ai["typestr"].endswith("f8")
+    assert ai["version"] == 3
+
+    with pytest.raises(AttributeError):
+        Vector([1, 2]).__array_interface__
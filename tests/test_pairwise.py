@@ -0,0 +1,150 @@
+import math
+import random
+
+import pytest
+
+from rvtools.ml import (
+    Dataset,
+    Matrix,
+    Vector,
+    cdist,
+    cosine_similarity,
+    euclidean_distance,
+    get_backend,
+    manhattan_distance,
+    pairwise_distances,
+    pairwise_distances_chunked,
+    set_backend,
+)
+from rvtools.ml import backend as backend_mod
+
+METRICS = ["euclidean", "sqeuclidean", "manhattan", "cosine"]
+
+
+def _reference(metric, x, y):
+    if metric == "euclidean":
+        return euclidean_distance(x, y)
+    if metric == "sqeuclidean":
+        return euclidean_distance(x, y) ** 2
+    if metric == "manhattan":
+        return manhattan_distance(x, y)
+    return 1.0 - cosine_similarity(x, y)
+
+
+def _rows(rnd, n, d):
+    return [[rnd.uniform(-5, 5) for _ in range(d)] for _ in range(n)]
+
+
+def _assert_matches(D, X, Y, metric):
+    assert D.shape == (len(X), len(Y))
+    for i, x in enumerate(X):
+        for j, y in enumerate(Y):
+            assert math.isclose(D[i, j], _reference(metric, x, y), rel_tol=1e-7, abs_tol=1e-7)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_cdist_matches_scalar_functions(metric):
+    rnd = random.Random(1)
+    X, Y = _rows(rnd, 13, 5), _rows(rnd, 9, 5)
+    for chunk_size in (1, 4, 13, 256):
+        _assert_matches(cdist(X, Y, metric, chunk_size=chunk_size), X, Y, metric)
+
+
+@pytest.mark.parametrize("metric", METRICS)
+def test_self_distances_zero_diagonal(metric):
+    rnd = random.Random(2)
+    X = _rows(rnd, 11, 4)
+    D = pairwise_distances(X, metric=metric, chunk_size=3)
+    assert all(D[i, i] == 0.0 for i in range(len(X)))
+    for i in range(len(X)):
+        for j in range(len(X)):
+            if i != j:
+                assert math.isclose(D[i, j], _reference(metric, X[i], X[j]), rel_tol=1e-7, abs_tol=1e-7)
+                assert math.isclose(D[i, j], D[j, i])
+
+
+def test_chunk_boundaries():
+    rnd = random.Random(3)
+    X, Y = _rows(rnd, 10, 3), _rows(rnd, 4, 3)
+    chunks = list(pairwise_distances_chunked(X, Y, chunk_size=4))
+    assert [start for start, _ in chunks] == [0, 4, 8]
+    assert [block.shape for _, block in chunks] == [(4, 4), (4, 4), (2, 4)]
+    full = cdist(X, Y).to_lists()
+    for start, block in chunks:
+        assert block.to_lists() == full[start:start + block.nrows]
+
+
+def test_accepts_matrix_dataset_and_vectors():
+    rnd = random.Random(4)
+    X, Y = _rows(rnd, 5, 3), _rows(rnd, 6, 3)
+    expected = cdist(X, Y).to_lists()
+    assert cdist(Matrix(X), Dataset(Y)).to_lists() == expected
+    assert cdist([Vector(x, typed=True) for x in X], Matrix(Y).T().T()).to_lists() == expected
+
+
+def test_workers_match_serial():
+    rnd = random.Random(5)
+    X, Y = _rows(rnd, 40, 6), _rows(rnd, 7, 6)
+    for metric in METRICS:
+        serial = cdist(X, Y, metric, chunk_size=6)
+        parallel = cdist(X, Y, metric, chunk_size=6, workers=2)
+        assert parallel.to_lists() == serial.to_lists()
+    assert (pairwise_distances(X, chunk_size=6, workers=2).to_lists()
+            == pairwise_distances(X, chunk_size=6).to_lists())
+
+
+def test_argument_errors():
+    with pytest.raises(ValueError):
+        cdist([[0.0, 0.0], [1.0, 1.0]], [[1.0, 2.0]], "cosine")
+    with pytest.raises(ValueError):
+        pairwise_distances([[1.0, 0.0], [0.0, 0.0]], metric="cosine")
+    with pytest.raises(ValueError):
+        cdist([[1.0]], [[1.0, 2.0]])
+    with pytest.raises(ValueError):
+        cdist([[1.0]], [[1.0]], "chebyshev")
+    with pytest.raises(ValueError):
+        cdist([], [[1.0]])
+    with pytest.raises(ValueError):
+        cdist([[1.0], [1.0, 2.0]], [[1.0]])
+    with pytest.raises(ValueError):
+        cdist([[1.0]], [[1.0]], chunk_size=0)
+    with pytest.raises(TypeError):
+        cdist([[1.0]], None)
+
+
+def test_errors_raised_at_call_time():
+    with pytest.raises(ValueError):
+        pairwise_distances_chunked([[1.0]], [[1.0, 2.0]])
+
+
+def test_consuming_does_not_switch_global_backend(monkeypatch):
+    calls = []
+
+    class Counting(backend_mod.PythonBackend):
+        name = "counting"
+
+        def pairwise(self, *args):
+            calls.append(1)
+            return super().pairwise(*args)
+
+    monkeypatch.setitem(backend_mod._BACKENDS, "counting", Counting)
+    previous = get_backend().name
+    try:
+        set_backend("counting")
+        chunks = pairwise_distances_chunked([[1.0], [2.0], [3.0]], chunk_size=1)
+        set_backend("python")
+        assert next(chunks)[0] == 0
+        assert get_backend().name == "python"
+        assert [start for start, _ in chunks] == [1, 2]
+        assert get_backend().name == "python"
+        # every block ran on the backend captured at call time
+        assert len(calls) == 3
+    finally:
+        set_backend(previous)
+
+
+def test_cosine_similarity_is_normalized():
+    assert math.isclose(cosine_similarity([3.0, 4.0], [4.0, 3.0]), 24 / 25)
+    assert math.isclose(Vector([1.0, 0.0]).cosine_similarity([5.0, 0.0]), 1.0)
+    with pytest.raises(ValueError):
+        cosine_similarity([0.0, 0.0], [1.0, 1.0])
@@ -0,0 +1,26 @@
+import pytest
+
+from rvtools._parallel import imap_with_state
+from rvtools.ds import Graph
+
+
+def _scaled(state, item):
+    return state * item
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_results_in_order(workers):
+    assert list(imap_with_state(_scaled, 3, range(10), workers, chunksize=2)) == [3 * i for i in range(10)]
+
+
+def test_empty_and_single_item_run_serially():
+    assert list(imap_with_state(_scaled, 2, [], workers=4)) == []
+    assert list(imap_with_state(_scaled, 2, [5], workers=4)) == [10]
+
+
+def test_spawn_start_method():
+    # state is pickled rather than inherited, as on macOS and Windows
+    csr = Graph.from_edges([(0, 1), (1, 2), (3, 4)]).freeze()
+    indices = [csr.index(v) for v in csr.ids]
+    rows = imap_with_state(type(csr)._distances, csr, indices, workers=2, chunksize=1, start_method="spawn")
+    assert [list(r) for r in rows] == [list(csr.bfs_distances(v)) for v in csr.ids]
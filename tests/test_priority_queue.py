@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from rvtools.ds import PriorityQueue
+
+
+def _check(pq, ref):
+    d = pq._d
+    items, prios = pq._items, pq._prios
+    assert len(items) == len(prios) == len(pq._pos) == len(ref)
+    for i, item in enumerate(items):
+        assert pq._pos[item] == i
+        assert prios[i] == ref[item]
+        if i:
+            assert prios[(i - 1) // d] <= prios[i]
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 7])
+@pytest.mark.parametrize("seed", range(3))
+def test_invariants_under_random_ops(arity, seed):
+    rnd = random.Random(seed)
+    ref = {i: rnd.randrange(50) for i in range(20)}
+    pq = PriorityQueue(ref.items(), arity=arity)
+    _check(pq, ref)
+    next_item = 20
+
+    for _ in range(2000):
+        r = rnd.random()
+        if r < 0.25 or not ref:
+            ref[next_item] = rnd.randrange(100)
+            pq.push(next_item, ref[next_item])
+            next_item += 1
+        elif r < 0.45:
+            item, prio = pq.pop()
+            assert prio == min(ref.values())
+            assert ref.pop(item) == prio
+        elif r < 0.65:
+            item = rnd.choice(list(ref))
+            ref[item] = rnd.randrange(100)
+            pq.update(item, ref[item])
+        elif r < 0.8:
+            item = rnd.choice(list(ref))
+            new = ref[item] - rnd.randrange(10)
+            pq.decrease_key(item, new)
+            ref[item] = new
+        else:
+            item = rnd.choice(list(ref))
+            assert pq.remove(item) == ref.pop(item)
+            assert item not in pq
+        _check(pq, ref)
+        if ref:
+            assert pq.peek()[1] == min(ref.values())
+
+    drained = [pq.pop()[1] for _ in range(len(pq))]
+    assert drained == sorted(drained)
+    assert pq.is_empty()
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        PriorityQueue(arity=1)
+    with pytest.raises(KeyError):
+        PriorityQueue([("a", 1), ("a", 2)])
+
+    pq = PriorityQueue([("a", 5)])
+    with pytest.raises(KeyError):
+        pq.push("a", 1)
+    with pytest.raises(ValueError):
+        pq.decrease_key("a", 6)
+    with pytest.raises(KeyError):
+        pq.update("missing", 1)
+    assert pq.priority("a") == 5
+
+    pq.pop()
+    with pytest.raises(IndexError):
+        pq.pop()
+    with pytest.raises(IndexError):
+        pq.peek()
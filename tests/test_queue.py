@@ -0,0 +1,96 @@
+import random
+from collections import deque
+
+import pytest
+
+from rvtools.ds import Queue
+
+
+def _op(rnd, q, ref, counter):
+    r = rnd.random()
+    if r < 0.35:
+        v = next(counter)
+        if q.capacity is not None and len(ref) == q.capacity and q.overflow == "raise":
+            with pytest.raises(IndexError):
+                q.enqueue(v)
+        else:
+            q.enqueue(v)
+            ref.append(v)
+    elif r < 0.55:
+        k = rnd.randrange(0, 2 * (q.capacity or 8) + 2)
+        vals = [next(counter) for _ in range(k)]
+        if q.capacity is not None and len(ref) + k > q.capacity and q.overflow == "raise":
+            with pytest.raises(IndexError):
+                q.enqueue_many(vals)
+        else:
+            q.enqueue_many(iter(vals))
+            ref.extend(vals)
+    elif r < 0.8:
+        if ref:
+            assert q.peek() == ref[0]
+            assert q.dequeue() == ref.popleft()
+        else:
+            with pytest.raises(IndexError):
+                q.dequeue()
+            with pytest.raises(IndexError):
+                q.peek()
+    else:
+        n = rnd.randrange(0, 12)
+        assert q.dequeue_many(n) == [ref.popleft() for _ in range(min(n, len(ref)))]
+
+
+@pytest.mark.parametrize("capacity", [None, 1, 2, 3, 5, 8, 13])
+@pytest.mark.parametrize("overflow", ["raise", "overwrite"])
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_deque(capacity, overflow, seed):
+    rnd = random.Random(seed)
+    q = Queue(capacity=capacity, overflow=overflow)
+    # maxlen drops the oldest items, which is exactly overwrite mode; in
+    # raise mode _op never lets ref exceed capacity
+    ref = deque(maxlen=capacity if overflow == "overwrite" else None)
+    counter = iter(range(10**9))
+
+    for _ in range(2000):
+        _op(rnd, q, ref, counter)
+        assert q.to_list() == list(ref)
+        assert len(q) == len(ref)
+        assert q.is_empty() == (not ref)
+        assert q.is_full() == (capacity is not None and len(ref) == capacity)
+        if capacity is not None:
+            assert len(q._buf) == capacity
+
+
+def test_wraparound_and_growth():
+    q = Queue()
+    for i in range(6):
+        q.enqueue(i)
+    assert q.dequeue_many(5) == [0, 1, 2, 3, 4]
+    q.enqueue_many(range(6, 12))        # wraps past the end of the buffer
+    assert q._head + len(q) > len(q._buf)
+    assert q.to_list() == [5, 6, 7, 8, 9, 10, 11]
+
+    q.enqueue_many(range(12, 30))       # grows while wrapped
+    assert len(q._buf) == 32
+    assert q.to_list() == list(range(5, 30))
+
+
+def test_overwrite_with_large_batches():
+    q = Queue(capacity=4, overflow="overwrite")
+    q.enqueue_many([1, 2, 3])
+    q.dequeue()
+    q.enqueue_many(range(10, 14))       # k == capacity
+    assert q.to_list() == [10, 11, 12, 13]
+    q.enqueue_many(range(20, 30))       # k > capacity
+    assert q.to_list() == [26, 27, 28, 29]
+    q.enqueue(30)
+    assert q.to_list() == [27, 28, 29, 30]
+    assert q.dequeue() == 27
+
+
+def test_bad_args():
+    with pytest.raises(ValueError):
+        Queue(capacity=0)
+    with pytest.raises(ValueError):
+        Queue(overflow="drop")
+    with pytest.raises(ValueError):
+        Queue().dequeue_many(-1)
@@ -0,0 +1,92 @@
+import random
+from bisect import bisect_left, insort
+
+import pytest
+
+from rvtools.ds import SortedList
+
+
+def _check(sl, ref):
+    assert sl.to_list() == ref
+    assert len(sl) == len(ref)
+    assert all(sl._blocks) and all(len(b) <= 2 * sl._load for b in sl._blocks)
+    assert sl._maxes == [b[-1] for b in sl._blocks]
+    if ref:
+        assert sl.min() == ref[0] and sl.max() == ref[-1]
+
+
+@pytest.mark.parametrize("typecode", [None, "q"])
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_sorted_reference(typecode, seed):
+    rnd = random.Random(seed)
+    sl = SortedList(load=3, typecode=typecode)
+    ref = []
+    splits = folds = 0
+
+    for step in range(3000):
+        blocks = len(sl._blocks)
+        # grow for the first half, then shrink, with duplicates throughout
+        if rnd.random() < (0.7 if step < 1500 else 0.35):
+            v = rnd.randrange(200)
+            sl.append(v)
+            insort(ref, v)
+            splits += len(sl._blocks) > blocks
+        else:
+            v = rnd.randrange(200)
+            present = v in ref
+            assert sl.contains_val(v) == present and (v in sl) == present
+            sl.delete(v)
+            if present:
+                ref.pop(bisect_left(ref, v))
+            folds += len(sl._blocks) < blocks
+
+        if step % 50 == 0:
+            _check(sl, ref)
+            lo = rnd.randrange(-10, 210)
+            hi = lo + rnd.randrange(-5, 80)
+            expected = [x for x in ref if lo <= x <= hi]
+            assert list(sl.iter_range(lo, hi)) == expected
+            assert sl.count_range(lo, hi) == len(expected)
+
+    _check(sl, ref)
+    assert splits > 10 and folds > 10
+
+
+@pytest.mark.parametrize("typecode", [None, "d"])
+def test_ranges_across_block_boundaries(typecode):
+    values = [float(v) for v in range(20) for _ in range(2)]
+    sl = SortedList.from_sorted(values, load=4, typecode=typecode)
+    assert len(sl._blocks) == 10
+
+    for lo in range(-1, 21):
+        for hi in range(lo - 1, 22):
+            expected = [v for v in values if lo <= v <= hi]
+            assert list(sl.iter_range(lo, hi)) == expected
+            assert sl.count_range(lo, hi) == len(expected)
+
+
+def test_typecode_blocks_are_arrays():
+    sl = SortedList.from_iterable([5, 1, 3], load=2, typecode="q")
+    for v in [2, 4, 6, 0]:
+        sl.append(v)
+    assert all(b.typecode == "q" for b in sl._blocks)
+    assert sl.to_list() == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_errors_and_clear():
+    with pytest.raises(ValueError):
+        SortedList(load=1)
+    with pytest.raises(ValueError):
+        SortedList.from_sorted([1, 3, 2])
+
+    sl = SortedList()
+    with pytest.raises(ValueError):
+        sl.min()
+    with pytest.raises(ValueError):
+        sl.max()
+    assert list(sl.iter_range(0, 10)) == [] and sl.count_range(0, 10) == 0
+
+    sl.append(1)
+    sl.delete(99)
+    sl.clear()
+    assert len(sl) == 0 and sl.to_list() == []
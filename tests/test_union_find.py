@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from rvtools.ds import UnionFind
+
+
+def test_basic_ops():
+    uf = UnionFind("abcd")
+    assert len(uf) == 4 and uf.num_sets == 4
+    assert uf.union("a", "b")
+    assert not uf.union("b", "a")
+    assert uf.union("c", "d")
+    assert uf.connected("a", "b") and not uf.connected("a", "c")
+    assert uf.num_sets == 2
+    assert uf.groups() == [["a", "b"], ["c", "d"]]
+
+    uf.add("e")
+    uf.add("e")
+    assert "e" in uf and uf.num_sets == 3
+
+    with pytest.raises(ValueError):
+        uf.find("z")
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_naive_partition(seed):
+    rnd = random.Random(seed)
+    n = 60
+    uf = UnionFind(range(n))
+    label = list(range(n))      # naive: relabel a whole set on every merge
+
+    for _ in range(200):
+        a, b = rnd.randrange(n), rnd.randrange(n)
+        merged = label[a] != label[b]
+        assert uf.union(a, b) == merged
+        if merged:
+            old = label[b]
+            label = [label[a] if x == old else x for x in label]
+
+        x, y = rnd.randrange(n), rnd.randrange(n)
+        assert uf.connected(x, y) == (label[x] == label[y])
+        assert uf.num_sets == len(set(label))
+
+    groups = uf.groups()
+    assert sorted(map(sorted, groups)) == sorted(
+        sorted(i for i in range(n) if label[i] == l) for l in set(label))
+
+
+def test_long_chain_find_is_iterative():
+    n = 100_000
+    uf = UnionFind(range(n))
+    # link roots by hand into one long path to defeat union by rank
+    for i in range(n - 1):
+        uf._parent[i] = i + 1
+    assert uf.find(0) == n - 1
+    assert uf._parent[0] == n - 1